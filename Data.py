@@ -1,4 +1,5 @@
-from queue import Queue
+from rta import RTAHistory, ChannelRTAHistory, RTAMailbox, SpectrogramBuffer
+from table_cache import tableNames
 
 # hardcoded frequencies based on /meters/15 data
 frequencies = [
@@ -14,8 +15,23 @@ frequencies = [
     10000, 10720, 11490, 12310, 13200, 14140, 15160, 16250, 17410, 18660
 ]
 
-# rta data structure (dict of lists)
-dataRTA = {freq: [-90.0] for freq in frequencies}
+# rta history depth in frames
+depthRTA = 10
+
+# rta data structure (ring buffer of frames, one column per frequency)
+dataRTA = RTAHistory(len(frequencies), depth=depthRTA)
+
+# number of input channels on the console
+numChannels = 32
+
+# per-channel rta histories for the multi-channel auto-eq, filled while each channel is the rta source
+channelsRTA = ChannelRTAHistory(numChannels, len(frequencies), depth=depthRTA)
+
+# waterfall history in frames (about 3.5 minutes at 20 frames per second)
+spectrogramFrames = 4096
+
+# rta waterfall image (circular uint8 buffer, one row per frame)
+spectrogramRTA = SpectrogramBuffer(len(frequencies), spectrogramFrames)
 
 # Define gain multipliers for different vocal types and bands
 gainMultis = {
@@ -185,146 +201,6 @@ bandRanges = { # band_name: [(freq_id, freq), ...]
         (1.0000, 20000)]
 }
 
-qValues = {     # q_value:q_id from 10.0 to 0.3
-    10.0: 0.0000,
-    9.5: 0.0141,
-    9.1: 0.0282,
-    8.6: 0.0423,
-    8.2: 0.0563,
-    7.8: 0.0704,
-    7.4: 0.0845,
-    7.1: 0.0986,
-    6.7: 0.1127,
-    6.4: 0.1268,
-    6.1: 0.1408,
-    5.8: 0.1549,
-    5.5: 0.1690,
-    5.3: 0.1831,
-    5.0: 0.1972,
-    4.8: 0.2113,
-    4.5: 0.2254,
-    4.3: 0.2394,
-    4.1: 0.2535,
-    3.9: 0.2676,
-    3.7: 0.2817,
-    3.5: 0.2958,
-    3.4: 0.3099,
-    3.2: 0.3239,
-    3.1: 0.3380,
-    2.9: 0.3521,
-    2.8: 0.3662,
-    2.6: 0.3803,
-    2.5: 0.3944,
-    2.4: 0.4085,
-    2.3: 0.4225,
-    2.2: 0.4366,
-    2.1: 0.4507,
-    2.0: 0.4648,
-    1.9: 0.4789,
-    1.8: 0.4930,
-    1.7: 0.5070,
-    1.6: 0.5211,
-    1.5: 0.5352,
-    1.5: 0.5493,
-    1.4: 0.5634,
-    1.3: 0.5775,
-    1.3: 0.5915,
-    1.2: 0.6056,
-    1.1: 0.6197,
-    1.1: 0.6338,
-    1.0: 0.6479,
-    1.0: 0.6620,
-    0.9: 0.6761,
-    0.9: 0.6901,
-    0.8: 0.7042,
-    0.8: 0.7183,
-    0.8: 0.7324,
-    0.7: 0.7465,
-    0.7: 0.7606,
-    0.7: 0.7746,
-    0.6: 0.7887,
-    0.6: 0.8028,
-    0.6: 0.8169,
-    0.5: 0.8310,
-    0.5: 0.8451,
-    0.5: 0.8592,
-    0.5: 0.8732,
-    0.4: 0.8873,
-    0.4: 0.9014,
-    0.4: 0.9155,
-    0.4: 0.9296,
-    0.4: 0.9437,
-    0.3: 0.9577,
-    0.3: 0.9718,
-    0.3: 0.9859,
-    0.3: 1.0000
-}
-
-eqGainValues = {   # gain_db_value:gain_id   -15.0 to 15.0
-    -15.0: 0.00,
-    -14.7: 0.01,
-    -14.5: 0.02,
-    -14.0: 0.04,
-    -13.5: 0.05,
-    -13.0: 0.07,
-    -12.5: 0.08,
-    -12.0: 0.10,
-    -11.5: 0.12,
-    -11.0: 0.13,
-    -10.5: 0.15,
-    -10.0: 0.17,
-    -9.5:  0.18,
-    -9.0:  0.20,
-    -8.5:  0.22,
-    -8.0:  0.23,
-    -7.5:  0.25,
-    -7.0:  0.27,
-    -6.5:  0.28,
-    -6.0:  0.30,
-    -5.5:  0.32,
-    -5.0:  0.33,
-    -4.5:  0.35,
-    -4.0:  0.37,
-    -3.5:  0.38,
-    -3.0:  0.40,
-    -2.5:  0.42,
-    -2.0:  0.43,
-    -1.5:  0.45,
-    -1.0:  0.47,
-    -0.5:  0.48,
-     0.0:  0.50,
-     0.5:  0.52,
-     1.0:  0.53,
-     1.5:  0.55,
-     2.0:  0.57,
-     2.5:  0.58,
-     3.0:  0.60,
-     3.5:  0.62,
-     4.0:  0.63,
-     4.5:  0.65,
-     5.0:  0.67,
-     5.5:  0.68,
-     6.0:  0.70,
-     6.5:  0.72,
-     7.0:  0.73,
-     7.5:  0.75,
-     8.0:  0.77,
-     8.5:  0.78,
-     9.0:  0.80,
-     9.5:  0.82,
-    10.0:  0.83,
-    10.5:  0.85,
-    11.0:  0.87,
-    11.5:  0.88,
-    12.0:  0.90,
-    12.5:  0.92,
-    13.0:  0.93,
-    13.5:  0.95,
-    14.0:  0.97,
-    14.5:  0.98,
-    15.0:  1.00
-}
-
 # Define band ranges for RTA
 bandsRangeRTA = {
     'Low': (136, 385),
@@ -337,1118 +213,13 @@ bandsRangeRTA = {
 gainOffset = 38
 
 # global variables
-queueRTA = Queue()
+mailboxRTA = RTAMailbox()   # latest rta frame, overwritten when unread
 receivedFirstRTA = False
 bars = {}
 
-faderData = {       # fader_id:gain_db_value from -90.0 to 10.0
-    "-90.0": 0.0,
-    "-89.5": 0.001,
-    "-89.1": 0.002,
-    "-88.6": 0.0029,
-    "-88.1": 0.0039,
-    "-87.7": 0.0049,
-    "-87.2": 0.0059,
-    "-86.7": 0.0068,
-    "-86.2": 0.0078,
-    "-85.8": 0.0088,
-    "-85.3": 0.0098,
-    "-84.8": 0.0108,
-    "-84.4": 0.0117,
-    "-83.9": 0.0127,
-    "-83.4": 0.0137,
-    "-83": 0.0147,
-    "-82.5": 0.0156,
-    "-82": 0.0166,
-    "-81.6": 0.0176,
-    "-81.1": 0.0186,
-    "-80.6": 0.0196,
-    "-80.1": 0.0205,
-    "-79.7": 0.0215,
-    "-79.2": 0.0225,
-    "-78.7": 0.0235,
-    "-78.3": 0.0244,
-    "-77.8": 0.0254,
-    "-77.3": 0.0264,
-    "-76.9": 0.0274,
-    "-76.4": 0.0283,
-    "-75.9": 0.0293,
-    "-75.5": 0.0303,
-    "-75": 0.0313,
-    "-74.5": 0.0323,
-    "-74": 0.0332,
-    "-73.6": 0.0342,
-    "-73.1": 0.0352,
-    "-72.6": 0.0362,
-    "-72.2": 0.0371,
-    "-71.7": 0.0381,
-    "-71.2": 0.0391,
-    "-70.8": 0.0401,
-    "-70.3": 0.0411,
-    "-69.8": 0.042,
-    "-69.4": 0.043,
-    "-68.9": 0.044,
-    "-68.4": 0.045,
-    "-67.9": 0.0459,
-    "-67.5": 0.0469,
-    "-67": 0.0479,
-    "-66.5": 0.0489,
-    "-66.1": 0.0499,
-    "-65.6": 0.0508,
-    "-65.1": 0.0518,
-    "-64.7": 0.0528,
-    "-64.2": 0.0538,
-    "-63.7": 0.0547,
-    "-63.3": 0.0557,
-    "-62.8": 0.0567,
-    "-62.3": 0.0577,
-    "-61.8": 0.0587,
-    "-61.4": 0.0596,
-    "-60.9": 0.0606,
-    "-60.4": 0.0616,
-    "-60": 0.0626,
-    "-59.8": 0.0635,
-    "-59.7": 0.0645,
-    "-59.5": 0.0655,
-    "-59.4": 0.0665,
-    "-59.2": 0.0674,
-    "-59.1": 0.0684,
-    "-58.9": 0.0694,
-    "-58.7": 0.0704,
-    "-58.6": 0.0714,
-    "-58.4": 0.0723,
-    "-58.3": 0.0733,
-    "-58.1": 0.0743,
-    "-58": 0.0753,
-    "-57.8": 0.0762,
-    "-57.6": 0.0772,
-    "-57.5": 0.0782,
-    "-57.3": 0.0792,
-    "-57.2": 0.0802,
-    "-57": 0.0811,
-    "-56.9": 0.0821,
-    "-56.7": 0.0831,
-    "-56.5": 0.0841,
-    "-56.4": 0.085,
-    "-56.2": 0.086,
-    "-56.1": 0.087,
-    "-55.9": 0.088,
-    "-55.8": 0.089,
-    "-55.6": 0.0899,
-    "-55.5": 0.0909,
-    "-55.3": 0.0919,
-    "-55.1": 0.0929,
-    "-55": 0.0938,
-    "-54.8": 0.0948,
-    "-54.7": 0.0958,
-    "-54.5": 0.0968,
-    "-54.4": 0.0978,
-    "-54.2": 0.0987,
-    "-54": 0.0997,
-    "-53.9": 0.1007,
-    "-53.7": 0.1017,
-    "-53.6": 0.1026,
-    "-53.4": 0.1036,
-    "-53.3": 0.1046,
-    "-53.1": 0.1056,
-    "-53": 0.1065,
-    "-52.8": 0.1075,
-    "-52.6": 0.1085,
-    "-52.5": 0.1095,
-    "-52.3": 0.1105,
-    "-52.2": 0.1114,
-    "-52": 0.1124,
-    "-51.9": 0.1134,
-    "-51.7": 0.1144,
-    "-51.5": 0.1153,
-    "-51.4": 0.1163,
-    "-51.2": 0.1173,
-    "-51.1": 0.1183,
-    "-50.9": 0.1193,
-    "-50.8": 0.1202,
-    "-50.6": 0.1212,
-    "-50.4": 0.1222,
-    "-50.3": 0.1232,
-    "-50.1": 0.1241,
-    "-50": 0.1251,
-    "-49.8": 0.1261,
-    "-49.7": 0.1271,
-    "-49.5": 0.1281,
-    "-49.4": 0.129,
-    "-49.2": 0.13,
-    "-49": 0.131,
-    "-48.9": 0.132,
-    "-48.7": 0.1329,
-    "-48.6": 0.1339,
-    "-48.4": 0.1349,
-    "-48.3": 0.1359,
-    "-48.1": 0.1369,
-    "-47.9": 0.1378,
-    "-47.8": 0.1388,
-    "-47.6": 0.1398,
-    "-47.5": 0.1408,
-    "-47.3": 0.1417,
-    "-47.2": 0.1427,
-    "-47": 0.1437,
-    "-46.9": 0.1447,
-    "-46.7": 0.1457,
-    "-46.5": 0.1466,
-    "-46.4": 0.1476,
-    "-46.2": 0.1486,
-    "-46.1": 0.1496,
-    "-45.9": 0.1505,
-    "-45.8": 0.1515,
-    "-45.6": 0.1525,
-    "-45.4": 0.1535,
-    "-45.3": 0.1544,
-    "-45.1": 0.1554,
-    "-45": 0.1564,
-    "-44.8": 0.1574,
-    "-44.7": 0.1584,
-    "-44.5": 0.1593,
-    "-44.3": 0.1603,
-    "-44.2": 0.1613,
-    "-44": 0.1623,
-    "-43.9": 0.1632,
-    "-43.7": 0.1642,
-    "-43.6": 0.1652,
-    "-43.4": 0.1662,
-    "-43.3": 0.1672,
-    "-43.1": 0.1681,
-    "-42.9": 0.1691,
-    "-42.8": 0.1701,
-    "-42.6": 0.1711,
-    "-42.5": 0.172,
-    "-42.3": 0.173,
-    "-42.2": 0.174,
-    "-42": 0.175,
-    "-41.8": 0.176,
-    "-41.7": 0.1769,
-    "-41.5": 0.1779,
-    "-41.4": 0.1789,
-    "-41.2": 0.1799,
-    "-41.1": 0.1808,
-    "-40.9": 0.1818,
-    "-40.8": 0.1828,
-    "-40.6": 0.1838,
-    "-40.4": 0.1848,
-    "-40.3": 0.1857,
-    "-40.1": 0.1867,
-    "-40": 0.1877,
-    "-39.8": 0.1887,
-    "-39.7": 0.1896,
-    "-39.5": 0.1906,
-    "-39.3": 0.1916,
-    "-39.2": 0.1926,
-    "-39": 0.1935,
-    "-38.9": 0.1945,
-    "-38.7": 0.1955,
-    "-38.6": 0.1965,
-    "-38.4": 0.1975,
-    "-38.3": 0.1984,
-    "-38.1": 0.1994,
-    "-37.9": 0.2004,
-    "-37.8": 0.2014,
-    "-37.6": 0.2023,
-    "-37.5": 0.2033,
-    "-37.3": 0.2043,
-    "-37.2": 0.2053,
-    "-37": 0.2063,
-    "-36.8": 0.2072,
-    "-36.7": 0.2082,
-    "-36.5": 0.2092,
-    "-36.4": 0.2102,
-    "-36.2": 0.2111,
-    "-36.1": 0.2121,
-    "-35.9": 0.2131,
-    "-35.7": 0.2141,
-    "-35.6": 0.2151,
-    "-35.4": 0.216,
-    "-35.3": 0.217,
-    "-35.1": 0.218,
-    "-35": 0.219,
-    "-34.8": 0.2199,
-    "-34.7": 0.2209,
-    "-34.5": 0.2219,
-    "-34.3": 0.2229,
-    "-34.2": 0.2239,
-    "-34": 0.2248,
-    "-33.9": 0.2258,
-    "-33.7": 0.2268,
-    "-33.6": 0.2278,
-    "-33.4": 0.2287,
-    "-33.2": 0.2297,
-    "-33.1": 0.2307,
-    "-32.9": 0.2317,
-    "-32.8": 0.2326,
-    "-32.6": 0.2336,
-    "-32.5": 0.2346,
-    "-32.3": 0.2356,
-    "-32.2": 0.2366,
-    "-32": 0.2375,
-    "-31.8": 0.2385,
-    "-31.7": 0.2395,
-    "-31.5": 0.2405,
-    "-31.4": 0.2414,
-    "-31.2": 0.2424,
-    "-31.1": 0.2434,
-    "-30.9": 0.2444,
-    "-30.7": 0.2454,
-    "-30.6": 0.2463,
-    "-30.4": 0.2473,
-    "-30.3": 0.2483,
-    "-30.1": 0.2493,
-    "-30": 0.2502,
-    "-29.9": 0.2512,
-    "-29.8": 0.2522,
-    "-29.7": 0.2542,
-    "-29.6": 0.2551,
-    "-29.5": 0.2561,
-    "-29.4": 0.2581,
-    "-29.3": 0.259,
-    "-29.2": 0.26,
-    "-29.1": 0.261,
-    "-29": 0.263,
-    "-28.9": 0.2639,
-    "-28.8": 0.2649,
-    "-28.7": 0.2669,
-    "-28.6": 0.2678,
-    "-28.5": 0.2688,
-    "-28.4": 0.2698,
-    "-28.3": 0.2717,
-    "-28.2": 0.2727,
-    "-28.1": 0.2737,
-    "-28": 0.2747,
-    "-27.9": 0.2766,
-    "-27.8": 0.2776,
-    "-27.7": 0.2786,
-    "-27.6": 0.2805,
-    "-27.5": 0.2815,
-    "-27.4": 0.2825,
-    "-27.3": 0.2835,
-    "-27.2": 0.2854,
-    "-27.1": 0.2864,
-    "-27": 0.2874,
-    "-26.9": 0.2893,
-    "-26.8": 0.2903,
-    "-26.7": 0.2913,
-    "-26.6": 0.2923,
-    "-26.5": 0.2942,
-    "-26.4": 0.2952,
-    "-26.3": 0.2962,
-    "-26.2": 0.2972,
-    "-26.1": 0.2991,
-    "-26": 0.3001,
-    "-25.9": 0.3011,
-    "-25.8": 0.303,
-    "-25.7": 0.304,
-    "-25.6": 0.305,
-    "-25.5": 0.306,
-    "-25.4": 0.3079,
-    "-25.3": 0.3089,
-    "-25.2": 0.3099,
-    "-25.1": 0.3118,
-    "-25": 0.3128,
-    "-24.9": 0.3138,
-    "-24.8": 0.3148,
-    "-24.7": 0.3167,
-    "-24.6": 0.3177,
-    "-24.5": 0.3187,
-    "-24.4": 0.3196,
-    "-24.3": 0.3216,
-    "-24.2": 0.3226,
-    "-24.1": 0.3236,
-    "-24": 0.3255,
-    "-23.9": 0.3265,
-    "-23.8": 0.3275,
-    "-23.7": 0.3284,
-    "-23.6": 0.3304,
-    "-23.5": 0.3314,
-    "-23.4": 0.3324,
-    "-23.3": 0.3333,
-    "-23.2": 0.3353,
-    "-23.1": 0.3363,
-    "-23": 0.3372,
-    "-22.9": 0.3392,
-    "-22.8": 0.3402,
-    "-22.7": 0.3412,
-    "-22.6": 0.3431,
-    "-22.5": 0.3441,
-    "-22.4": 0.3451,
-    "-22.3": 0.346,
-    "-22.2": 0.348,
-    "-22.1": 0.349,
-    "-22": 0.35,
-    "-21.9": 0.3509,
-    "-21.8": 0.3529,
-    "-21.7": 0.3539,
-    "-21.6": 0.3548,
-    "-21.5": 0.3568,
-    "-21.4": 0.3578,
-    "-21.3": 0.3587,
-    "-21.2": 0.3597,
-    "-21.1": 0.3617,
-    "-21": 0.3627,
-    "-20.9": 0.3636,
-    "-20.8": 0.3656,
-    "-20.7": 0.3666,
-    "-20.6": 0.3675,
-    "-20.5": 0.3685,
-    "-20.4": 0.3705,
-    "-20.3": 0.3715,
-    "-20.2": 0.3724,
-    "-20.1": 0.3734,
-    "-20": 0.3754,
-    "-19.9": 0.3763,
-    "-19.8": 0.3773,
-    "-19.7": 0.3793,
-    "-19.6": 0.3803,
-    "-19.5": 0.3812,
-    "-19.4": 0.3822,
-    "-19.3": 0.3842,
-    "-19.2": 0.3851,
-    "-19.1": 0.3861,
-    "-19": 0.3881,
-    "-18.9": 0.3891,
-    "-18.8": 0.39,
-    "-18.7": 0.391,
-    "-18.6": 0.393,
-    "-18.5": 0.3939,
-    "-18.4": 0.3949,
-    "-18.3": 0.3969,
-    "-18.2": 0.3978,
-    "-18.1": 0.3988,
-    "-18": 0.3998,
-    "-17.9": 0.4018,
-    "-17.8": 0.4027,
-    "-17.7": 0.4037,
-    "-17.6": 0.4047,
-    "-17.5": 0.4066,
-    "-17.4": 0.4076,
-    "-17.3": 0.4086,
-    "-17.2": 0.4106,
-    "-17.1": 0.4115,
-    "-17": 0.4125,
-    "-16.9": 0.4135,
-    "-16.8": 0.4154,
-    "-16.7": 0.4164,
-    "-16.6": 0.4174,
-    "-16.5": 0.4194,
-    "-16.4": 0.4203,
-    "-16.3": 0.4213,
-    "-16.2": 0.4223,
-    "-16.1": 0.4242,
-    "-16": 0.4252,
-    "-15.9": 0.4262,
-    "-15.8": 0.4272,
-    "-15.7": 0.4291,
-    "-15.6": 0.4301,
-    "-15.5": 0.4311,
-    "-15.4": 0.433,
-    "-15.3": 0.434,
-    "-15.2": 0.435,
-    "-15.1": 0.436,
-    "-15": 0.4379,
-    "-14.9": 0.4389,
-    "-14.8": 0.4399,
-    "-14.7": 0.4418,
-    "-14.6": 0.4428,
-    "-14.5": 0.4438,
-    "-14.4": 0.4448,
-    "-14.3": 0.4467,
-    "-14.2": 0.4477,
-    "-14.1": 0.4487,
-    "-14": 0.4497,
-    "-13.9": 0.4516,
-    "-13.8": 0.4526,
-    "-13.7": 0.4536,
-    "-13.6": 0.4555,
-    "-13.5": 0.4565,
-    "-13.4": 0.4575,
-    "-13.3": 0.4585,
-    "-13.2": 0.4604,
-    "-13.1": 0.4614,
-    "-13": 0.4624,
-    "-12.9": 0.4643,
-    "-12.8": 0.4653,
-    "-12.7": 0.4663,
-    "-12.6": 0.4673,
-    "-12.5": 0.4692,
-    "-12.4": 0.4702,
-    "-12.3": 0.4712,
-    "-12.2": 0.4731,
-    "-12.1": 0.4741,
-    "-12": 0.4751,
-    "-11.9": 0.4761,
-    "-11.8": 0.478,
-    "-11.7": 0.479,
-    "-11.6": 0.48,
-    "-11.5": 0.4809,
-    "-11.4": 0.4829,
-    "-11.3": 0.4839,
-    "-11.2": 0.4848,
-    "-11.1": 0.4868,
-    "-11": 0.4878,
-    "-10.9": 0.4888,
-    "-10.8": 0.4897,
-    "-10.7": 0.4917,
-    "-10.6": 0.4927,
-    "-10.5": 0.4936,
-    "-10.4": 0.4956,
-    "-10.3": 0.4966,
-    "-10.2": 0.4976,
-    "-10.1": 0.4985,
-    "-10": 0.5005,
-    "-9.9": 0.5034,
-    "-9.8": 0.5054,
-    "-9.7": 0.5083,
-    "-9.6": 0.5112,
-    "-9.5": 0.5132,
-    "-9.4": 0.5161,
-    "-9.3": 0.5181,
-    "-9.2": 0.521,
-    "-9.1": 0.523,
-    "-9": 0.5259,
-    "-8.9": 0.5279,
-    "-8.8": 0.5308,
-    "-8.7": 0.5347,
-    "-8.6": 0.5357,
-    "-8.5": 0.5386,
-    "-8.4": 0.5406,
-    "-8.3": 0.5435,
-    "-8.2": 0.5455,
-    "-8.1": 0.5484,
-    "-8": 0.5503,
-    "-7.9": 0.5533,
-    "-7.8": 0.5562,
-    "-7.7": 0.5582,
-    "-7.6": 0.5611,
-    "-7.5": 0.563,
-    "-7.4": 0.566,
-    "-7.3": 0.5679,
-    "-7.2": 0.5709,
-    "-7.1": 0.5728,
-    "-7": 0.5758,
-    "-6.9": 0.5787,
-    "-6.8": 0.5806,
-    "-6.7": 0.5836,
-    "-6.6": 0.5855,
-    "-6.5": 0.5885,
-    "-6.4": 0.5904,
-    "-6.3": 0.5934,
-    "-6.2": 0.5953,
-    "-6.1": 0.5982,
-    "-6": 0.6012,
-    "-5.9": 0.6031,
-    "-5.8": 0.6061,
-    "-5.7": 0.608,
-    "-5.6": 0.6109,
-    "-5.5": 0.6129,
-    "-5.4": 0.6158,
-    "-5.3": 0.6178,
-    "-5.2": 0.6207,
-    "-5.1": 0.6237,
-    "-5": 0.6256,
-    "-4.9": 0.6285,
-    "-4.8": 0.6305,
-    "-4.7": 0.6334,
-    "-4.6": 0.6354,
-    "-4.5": 0.6383,
-    "-4.4": 0.6403,
-    "-4.3": 0.6432,
-    "-4.2": 0.6461,
-    "-4.1": 0.6481,
-    "-4": 0.651,
-    "-3.9": 0.653,
-    "-3.8": 0.6559,
-    "-3.7": 0.6579,
-    "-3.6": 0.6608,
-    "-3.5": 0.6637,
-    "-3.4": 0.6657,
-    "-3.3": 0.6686,
-    "-3.2": 0.6706,
-    "-3.1": 0.6735,
-    "-3": 0.6755,
-    "-2.9": 0.6784,
-    "-2.8": 0.6804,
-    "-2.7": 0.6833,
-    "-2.6": 0.6862,
-    "-2.5": 0.6882,
-    "-2.4": 0.6911,
-    "-2.3": 0.6931,
-    "-2.2": 0.696,
-    "-2.1": 0.6979,
-    "-2": 0.7009,
-    "-1.9": 0.7028,
-    "-1.8": 0.7058,
-    "-1.7": 0.7087,
-    "-1.6": 0.7107,
-    "-1.5": 0.7136,
-    "-1.4": 0.7155,
-    "-1.3": 0.7185,
-    "-1.2": 0.7204,
-    "-1.1": 0.7234,
-    "-1": 0.7253,
-    "-0.9": 0.7283,
-    "-0.8": 0.7312,
-    "-0.7": 0.7331,
-    "-0.6": 0.7361,
-    "-0.5": 0.738,
-    "-0.4": 0.741,
-    "-0.3": 0.7429,
-    "-0.2": 0.7458,
-    "-0.1": 0.7468,
-    "0": 0.7517,
-    "0.1": 0.7537,
-    "0.2": 0.7556,
-    "0.3": 0.7586,
-    "0.4": 0.7605,
-    "0.5": 0.7634,
-    "0.6": 0.7654,
-    "0.7": 0.7683,
-    "0.8": 0.7703,
-    "0.9": 0.7732,
-    "1": 0.7761,
-    "1.1": 0.7781,
-    "1.2": 0.781,
-    "1.3": 0.783,
-    "1.4": 0.7859,
-    "1.5": 0.7879,
-    "1.6": 0.7908,
-    "1.7": 0.7937,
-    "1.8": 0.7957,
-    "1.9": 0.7986,
-    "2": 0.8006,
-    "2.1": 0.8035,
-    "2.2": 0.8055,
-    "2.3": 0.8084,
-    "2.4": 0.8104,
-    "2.5": 0.8133,
-    "2.6": 0.8162,
-    "2.7": 0.8182,
-    "2.8": 0.8211,
-    "2.9": 0.8231,
-    "3": 0.826,
-    "3.1": 0.828,
-    "3.2": 0.8309,
-    "3.3": 0.8328,
-    "3.4": 0.8358,
-    "3.5": 0.8387,
-    "3.6": 0.8407,
-    "3.7": 0.8436,
-    "3.8": 0.8456,
-    "3.9": 0.8485,
-    "4": 0.8504,
-    "4.1": 0.8534,
-    "4.2": 0.8553,
-    "4.3": 0.8583,
-    "4.4": 0.8612,
-    "4.5": 0.8631,
-    "4.6": 0.8661,
-    "4.7": 0.868,
-    "4.8": 0.871,
-    "4.9": 0.8729,
-    "5": 0.8759,
-    "5.1": 0.8778,
-    "5.2": 0.8807,
-    "5.3": 0.8837,
-    "5.4": 0.8856,
-    "5.5": 0.8886,
-    "5.6": 0.8905,
-    "5.7": 0.8935,
-    "5.8": 0.8954,
-    "5.9": 0.8983,
-    "6": 0.9003,
-    "6.1": 0.9032,
-    "6.2": 0.9062,
-    "6.3": 0.9081,
-    "6.4": 0.911,
-    "6.5": 0.913,
-    "6.6": 0.9159,
-    "6.7": 0.9179,
-    "6.8": 0.9208,
-    "6.9": 0.9228,
-    "7": 0.9257,
-    "7.1": 0.9286,
-    "7.2": 0.9306,
-    "7.3": 0.9335,
-    "7.4": 0.9355,
-    "7.5": 0.9384,
-    "7.6": 0.9404,
-    "7.7": 0.9433,
-    "7.8": 0.9462,
-    "7.9": 0.9482,
-    "8": 0.9511,
-    "8.1": 0.9531,
-    "8.2": 0.956,
-    "8.3": 0.958,
-    "8.4": 0.9609,
-    "8.5": 0.9629,
-    "8.6": 0.9658,
-    "8.7": 0.9687,
-    "8.8": 0.9707,
-    "8.9": 0.9736,
-    "9": 0.9756,
-    "9.1": 0.9785,
-    "9.2": 0.9804,
-    "9.3": 0.9834,
-    "9.4": 0.9853,
-    "9.5": 0.9883,
-    "9.6": 0.9912,
-    "9.7": 0.9932,
-    "9.8": 0.9961,
-    "9.9": 0.998,
-    "10": 1.0
-}
-
-eqFreq = {      # freq:freq_id from 20 to 20000
-    20.0: 0.0000,
-    20.7: 0.0050,
-    21.4: 0.0100,
-    22.2: 0.0150,
-    23.0: 0.0200,
-    23.8: 0.0250,
-    24.6: 0.0300,
-    25.5: 0.0350,
-    26.4: 0.0400,
-    27.3: 0.0450,
-    28.3: 0.0500,
-    29.2: 0.0550,
-    30.3: 0.0600,
-    31.3: 0.0650,
-    32.4: 0.0700,
-    33.6: 0.0750,
-    34.8: 0.0800,
-    36.0: 0.0850,
-    37.2: 0.0900,
-    38.6: 0.0950,
-    39.9: 0.1000,
-    41.3: 0.1050,
-    42.8: 0.1100,
-    44.3: 0.1150,
-    45.8: 0.1200,
-    47.4: 0.1250,
-    49.1: 0.1300,
-    50.8: 0.1350,
-    52.6: 0.1400,
-    54.5: 0.1450,
-    56.4: 0.1500,
-    58.3: 0.1550,
-    60.4: 0.1600,
-    62.5: 0.1650,
-    64.7: 0.1700,
-    67.0: 0.1750,
-    69.3: 0.1800,
-    71.8: 0.1850,
-    74.3: 0.1900,
-    76.9: 0.1950,
-    79.6: 0.2000,
-    82.4: 0.2050,
-    85.3: 0.2100,
-    88.3: 0.2150,
-    91.4: 0.2200,
-    94.6: 0.2250,
-    98.0: 0.2300,
-    101.4: 0.2350,
-    105.0: 0.2400,
-    108.7: 0.2450,
-    112.5: 0.2500,
-    116.4: 0.2550,
-    120.5: 0.2600,
-    124.7: 0.2650,
-    129.1: 0.2700,
-    133.7: 0.2750,
-    138.4: 0.2800,
-    143.2: 0.2850,
-    148.3: 0.2900,
-    153.5: 0.2950,
-    158.9: 0.3000,
-    164.4: 0.3050,
-    170.2: 0.3100,
-    176.2: 0.3150,
-    182.4: 0.3200,
-    188.8: 0.3250,
-    195.4: 0.3300,
-    202.3: 0.3350,
-    209.4: 0.3400,
-    216.8: 0.3450,
-    224.4: 0.3500,
-    232.3: 0.3550,
-    240.5: 0.3600,
-    248.9: 0.3650,
-    257.6: 0.3700,
-    266.7: 0.3750,
-    276.1: 0.3800,
-    285.8: 0.3850,
-    295.8: 0.3900,
-    306.2: 0.3950,
-    317.0: 0.4000,
-    328.1: 0.4050,
-    339.6: 0.4100,
-    351.6: 0.4150,
-    363.9: 0.4200,
-    376.7: 0.4250,
-    390.0: 0.4300,
-    403.7: 0.4350,
-    417.9: 0.4400,
-    432.5: 0.4450,
-    447.7: 0.4500,
-    463.5: 0.4550,
-    479.8: 0.4600,
-    496.6: 0.4650,
-    514.1: 0.4700,
-    532.1: 0.4750,
-    550.8: 0.4800,
-    570.2: 0.4850,
-    590.2: 0.4900,
-    611.0: 0.4950,
-    632.5: 0.5000,
-    654.7: 0.5050,
-    677.7: 0.5100,
-    701.5: 0.5150,
-    726.2: 0.5200,
-    751.7: 0.5250,
-    778.1: 0.5300,
-    805.4: 0.5350,
-    833.7: 0.5400,
-    863.0: 0.5450,
-    893.4: 0.5500,
-    924.8: 0.5550,
-    957.3: 0.5600,
-    990.9: 0.5650,
-    1020: 0.5700,
-    1060: 0.5750,
-    1090: 0.5800,
-    1130: 0.5850,
-    1170: 0.5900,
-    1210: 0.5950,
-    1260: 0.6000,
-    1300: 0.6050,
-    1350: 0.6100,
-    1390: 0.6150,
-    1440: 0.6200,
-    1490: 0.6250,
-    1550: 0.6300,
-    1600: 0.6350,
-    1660: 0.6400,
-    1720: 0.6450,
-    1780: 0.6500,
-    1840: 0.6550,
-    1910: 0.6600,
-    1970: 0.6650,
-    2040: 0.6700,
-    2110: 0.6750,
-    2190: 0.6800,
-    2270: 0.6850,
-    2340: 0.6900,
-    2430: 0.6950,
-    2510: 0.7000,
-    2600: 0.7050,
-    2690: 0.7100,
-    2790: 0.7150,
-    2890: 0.7200,
-    2990: 0.7250,
-    3090: 0.7300,
-    3200: 0.7350,
-    3310: 0.7400,
-    3430: 0.7450,
-    3550: 0.7500,
-    3680: 0.7550,
-    3810: 0.7600,
-    3940: 0.7650,
-    4080: 0.7700,
-    4220: 0.7750,
-    4370: 0.7800,
-    4520: 0.7850,
-    4680: 0.7900,
-    4850: 0.7950,
-    5020: 0.8000,
-    5200: 0.8050,
-    5380: 0.8100,
-    5570: 0.8150,
-    5760: 0.8200,
-    5970: 0.8250,
-    6180: 0.8300,
-    6390: 0.8350,
-    6620: 0.8400,
-    6850: 0.8450,
-    7090: 0.8500,
-    7340: 0.8550,
-    7600: 0.8600,
-    7870: 0.8650,
-    8150: 0.8700,
-    8440: 0.8750,
-    8740: 0.8800,
-    9050: 0.8850,
-    9370: 0.8900,
-    9700: 0.8950,
-    10020: 0.9000,
-    10350: 0.9050,
-    10680: 0.9100,
-    11010: 0.9150,
-    11350: 0.9200,
-    11700: 0.9250,
-    12050: 0.9300,
-    12400: 0.9350,
-    12850: 0.9400,
-    13310: 0.9450,
-    13770: 0.9500,
-    14250: 0.9550,
-    14730: 0.9600,
-    15250: 0.9650,
-    15800: 0.9700,
-    16370: 0.9750,
-    16950: 0.9800,
-    17530: 0.9850,
-    18150: 0.9900,
-    18820: 0.9950,
-    20000: 1.0000
-}
-
-lowcutFreq = {  # freq:freq_id from 20 to 400
-    20: 0.0000,
-    21: 0.0100,
-    22: 0.0300,
-    23: 0.0400,
-    24: 0.0600,
-    25: 0.0700,
-    26: 0.0900,
-    27: 0.1000,
-    28: 0.1100,
-    29: 0.1200,
-    30: 0.1300,
-    31: 0.1500,
-    32: 0.1600,
-    33: 0.1700,
-    34: 0.1800,
-    35: 0.1900,
-    36: 0.2000,
-    38: 0.2100,
-    39: 0.2200,
-    40: 0.2300,
-    41: 0.2400,
-    42: 0.2500,
-    44: 0.2600,
-    45: 0.2700,
-    46: 0.2800,
-    48: 0.2900,
-    49: 0.3000,
-    51: 0.3100,
-    52: 0.3200,
-    54: 0.3300,
-    55: 0.3400,
-    57: 0.3500,
-    59: 0.3600,
-    61: 0.3700,
-    62: 0.3800,
-    64: 0.3900,
-    66: 0.4000,
-    68: 0.4100,
-    70: 0.4200,
-    73: 0.4300,
-    75: 0.4400,
-    77: 0.4500,
-    79: 0.4600,
-    82: 0.4700,
-    84: 0.4800,
-    87: 0.4900,
-    89: 0.5000,
-    92: 0.5100,
-    95: 0.5200,
-    98: 0.5300,
-    101: 0.5400,
-    104: 0.5500,
-    107: 0.5600,
-    110: 0.5700,
-    114: 0.5800,
-    117: 0.5900,
-    121: 0.6000,
-    124: 0.6100,
-    128: 0.6200,
-    132: 0.6300,
-    136: 0.6400,
-    140: 0.6500,
-    144: 0.6600,
-    149: 0.6700,
-    153: 0.6800,
-    158: 0.6900,
-    163: 0.7000,
-    168: 0.7100,
-    173: 0.7200,
-    178: 0.7300,
-    184: 0.7400,
-    189: 0.7500,
-    195: 0.7600,
-    201: 0.7700,
-    207: 0.7800,
-    213: 0.7900,
-    220: 0.8000,
-    226: 0.8100,
-    233: 0.8200,
-    240: 0.8300,
-    248: 0.8400,
-    255: 0.8500,
-    263: 0.8600,
-    271: 0.8700,
-    279: 0.8800,
-    288: 0.8900,
-    296: 0.9000,
-    305: 0.9100,
-    315: 0.9200,
-    324: 0.9300,
-    334: 0.9400,
-    344: 0.9500,
-    355: 0.9600,
-    366: 0.9700,
-    377: 0.9800,
-    388: 0.9900,
-    400: 1.0000
-}
-
-trimValues = {  # trim:trim_id from -18 to 18
-    -18.00: 0.0000,
-    -17.8: 0.0069,
-    -17.5: 0.0139,
-    -17.25: 0.0208,
-    -17.00: 0.0278,
-    -16.75: 0.0347,
-    -16.5: 0.0417,
-    -16.25: 0.0486,
-    -16.00: 0.0556,
-    -15.75: 0.0625,
-    -15.5: 0.0694,
-    -15.25: 0.0764,
-    -15.00: 0.0833,
-    -14.75: 0.0903,
-    -14.5: 0.0972,
-    -14.25: 0.1042,
-    -14.00: 0.1111,
-    -13.75: 0.1181,
-    -13.5: 0.1250,
-    -13.25: 0.1319,
-    -13.00: 0.1389,
-    -12.75: 0.1458,
-    -12.5: 0.1528,
-    -12.25: 0.1597,
-    -12.00: 0.1667,
-    -11.75: 0.1736,
-    -11.5: 0.1806,
-    -11.25: 0.1875,
-    -11.00: 0.1944,
-    -10.75: 0.2014,
-    -10.5: 0.2083,
-    -10.25: 0.2153,
-    -10.00: 0.2222,
-    -9.75: 0.2292,
-    -9.5: 0.2361,
-    -9.25: 0.2431,
-    -9.00: 0.2500,
-    -8.75: 0.2569,
-    -8.5: 0.2639,
-    -8.25: 0.2708,
-    -8.00: 0.2778,
-    -7.75: 0.2847,
-    -7.5: 0.2917,
-    -7.25: 0.2986,
-    -7.00: 0.3056,
-    -6.75: 0.3125,
-    -6.5: 0.3194,
-    -6.25: 0.3264,
-    -6.00: 0.3333,
-    -5.75: 0.3403,
-    -5.5: 0.3472,
-    -5.25: 0.3542,
-    -5.00: 0.3611,
-    -4.75: 0.3681,
-    -4.5: 0.3750,
-    -4.25: 0.3819,
-    -4.00: 0.3889,
-    -3.75: 0.3958,
-    -3.5: 0.4028,
-    -3.25: 0.4097,
-    -3.00: 0.4167,
-    -2.75: 0.4236,
-    -2.5: 0.4306,
-    -2.25: 0.4375,
-    -2.00: 0.4444,
-    -1.75: 0.4514,
-    -1.5: 0.4583,
-    -1.25: 0.4653,
-    -1.00: 0.4722,
-    -0.75: 0.4792,
-    -0.5: 0.4861,
-    -0.25: 0.4931,
-    0.00: 0.5000,
-    0.25: 0.5069,
-    0.5: 0.5139,
-    0.75: 0.5208,
-    1.00: 0.5278,
-    1.25: 0.5347,
-    1.5: 0.5417,
-    1.75: 0.5486,
-    2.00: 0.5556,
-    2.25: 0.5625,
-    2.5: 0.5694,
-    2.75: 0.5764,
-    3.00: 0.5833,
-    3.25: 0.5903,
-    3.5: 0.5972,
-    3.75: 0.6042,
-    4.00: 0.6111,
-    4.25: 0.6181,
-    4.5: 0.6250,
-    4.75: 0.6319,
-    5.00: 0.6389,
-    5.25: 0.6458,
-    5.5: 0.6528,
-    5.75: 0.6597,
-    6.00: 0.6667,
-    6.25: 0.6736,
-    6.5: 0.6806,
-    6.75: 0.6875,
-    7.00: 0.6944,
-    7.25: 0.7014,
-    7.5: 0.7083,
-    7.75: 0.7153,
-    8.00: 0.7222,
-    8.25: 0.7292,
-    8.5: 0.7361,
-    8.75: 0.7431,
-    9.00: 0.7500,
-    9.25: 0.7569,
-    9.5: 0.7639,
-    9.75: 0.7708,
-    10.00: 0.7778,
-    10.25: 0.7847,
-    10.5: 0.7917,
-    10.75: 0.7986,
-    11.00: 0.8056,
-    11.25: 0.8125,
-    11.5: 0.8194,
-    11.75: 0.8264,
-    12.00: 0.8333,
-    12.25: 0.8403,
-    12.5: 0.8472,
-    12.75: 0.8542,
-    13.00: 0.8611,
-    13.25: 0.8681,
-    13.5: 0.8750,
-    13.75: 0.8819,
-    14.00: 0.8889,
-    14.25: 0.8958,
-    14.5: 0.9028,
-    14.75: 0.9097,
-    15.00: 0.9167,
-    15.25: 0.9236,
-    15.5: 0.9306,
-    15.75: 0.9375,
-    16.00: 0.9444,
-    16.25: 0.9514,
-    16.5: 0.9583,
-    16.75: 0.9653,
-    17.00: 0.9722,
-    17.25: 0.9792,
-    17.5: 0.9861,
-    17.8: 0.9931,
-    18.00: 1.0000
-}
\ No newline at end of file
+# Large parameter tables (table_cache.tableNames) live in DataTables.py and are only imported when first accessed
+def __getattr__(name):
+    if name in tableNames:
+        import DataTables
+        return getattr(DataTables, name)
+    raise AttributeError(f"module 'Data' has no attribute '{name}'")
@@ -1,16 +1,17 @@
 import sys
 import os
 import argparse
+import logging
 from PyQt6.QtWidgets import QApplication, QDialog
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 from ctypes import windll
-from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
 from pythonosc.udp_client import SimpleUDPClient
 
 from ui import MixerDiscoveryUI, AudioPilotUI
 from osc_handlers import RTASubscriber, OscHandlers
+from osc_transport import AsyncOSCTransport, FastPathDispatcher
 from utils import ApplicationManager
 
 # Explicit App User Model ID for Windows taskbar icon
@@ -74,31 +75,49 @@ if __name__ == "__main__":
         audioPilotUI.close()
         chosenIP = mixerDiscoveryDialog.selectedMixerIp
         chosenName = mixerDiscoveryDialog.selectedMixerName
-        client = SimpleUDPClient(chosenIP, 10023)
 
         parser = argparse.ArgumentParser()
         parser.add_argument("--ip", default="0.0.0.0", help="The IP to listen on")
         parser.add_argument("--port", type=int, default=10024, help="The port to listen on")
+        parser.add_argument("--transport", choices=["threading", "asyncio"], default="threading",
+                            help="OSC transport: a thread per datagram or a single asyncio event loop")
         args = parser.parse_args()
 
-        dispatcher = Dispatcher()
+        dispatcher = FastPathDispatcher()
+        transport = args.transport
+        if transport == "asyncio":
+            server = AsyncOSCTransport(dispatcher, (args.ip, args.port), (chosenIP, 10023))
+            server.xinfoReceived.connect(lambda ip, info: print(f"Mixer at {ip}: {info}"))
+            server.parameterReceived.connect(lambda address, args: logging.debug(f"Received {address} {args}"))
+            server.start()
+            server.bindFinished.wait(2)
+            if server.ready.is_set():
+                client = server  # outbound messages share the event loop's socket
+                oscServerThread = server
+            else:
+                print("Asyncio OSC transport did not start, falling back to the threading server")
+                server.stop()
+                transport = "threading"
+        if transport == "threading":
+            client = SimpleUDPClient(chosenIP, 10023)
+            server = ThreadingOSCUDPServer((args.ip, args.port), dispatcher)
+            client._sock = server.socket
+            oscServerThread = OSCServerThread(server)
+        print(f"Serving on {server.server_address}")
+
         subRTA = RTASubscriber(client)
         faderHandler = OscHandlers()
-        dispatcher.map("/meters", subRTA.handlerRTA)
+        dispatcher.mapBlobFastPath("/meters", subRTA.handlerRTA)
         #dispatcher.map("/fader", faderHandler.handlerFader)
 
-        server = ThreadingOSCUDPServer((args.ip, args.port), dispatcher)
-        print(f"Serving on {server.server_address}")
-        client._sock = server.socket
-
         # Update AudioPilotUI with the selected mixer details
         apUI = audioPilotUI
         apUI.mixerName = chosenName
         apUI.client = client
         apUI.updateUI()  # Update the UI with the new mixer settings
 
-        oscServerThread = OSCServerThread(server)
-        oscServerThread.start()
+        if not oscServerThread.isRunning():
+            oscServerThread.start()
 
         appManager = ApplicationManager(client, server, chosenName)
         appManager.run()
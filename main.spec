@@ -1,5 +1,13 @@
 # main.spec
 from PyInstaller.utils.hooks import collect_data_files
+import sys
+
+# PyInstaller only adds pathex to sys.path inside Analysis, so make the project importable here
+sys.path.insert(0, SPECPATH)
+import table_cache
+
+# Compile the parameter tables so the frozen app loads arrays instead of building DataTables.py dicts
+table_cache.compileTables()
 
 a = Analysis(
     ['main.py'],
@@ -9,11 +17,19 @@ a = Analysis(
         ('AudioPilot_Logo2.ico', '.'),
         ('AudioPilot_Logo2.png', '.'),
         ('styles.qss', '.'),
-        ('AudioPilot_Logo3.png', '.')
+        ('AudioPilot_Logo3.png', '.'),
+        (table_cache.cacheFileName, '.')
     ],
     hiddenimports=[
         'Data',
+        'DataTables',
+        'mappings',
+        'osc_client',
         'osc_handlers',
+        'osc_transport',
+        'quantizers',
+        'rta',
+        'table_cache',
         'ui',
         'utils',
         'pyqtgraph',
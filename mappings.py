@@ -0,0 +1,101 @@
+import importlib
+import math
+import numpy as np
+
+# Set to False to route every lookup through the Data.py tables instead of the closed-form laws
+analyticMappings = True
+
+def faderToDB(f):
+    f = np.asarray(f, dtype=np.float64)
+    return np.select([f >= 0.5, f >= 0.25, f >= 0.0625], [f * 40.0 - 30.0, f * 80.0 - 50.0, f * 160.0 - 70.0], f * 480.0 - 90.0)
+
+def dbToFader(d):
+    d = np.asarray(d, dtype=np.float64)
+    return np.select([d >= -10.0, d >= -30.0, d >= -60.0], [(d + 30.0) / 40.0, (d + 50.0) / 80.0, (d + 70.0) / 160.0], (d + 90.0) / 480.0)
+
+def logScale(low, high):
+    # value = low * (high / low) ** f, for parameters the console spaces logarithmically
+    ratio = math.log(high / low)
+    toValue = lambda f: low * np.exp(np.asarray(f, dtype=np.float64) * ratio)
+    toFloat = lambda v: np.log(np.asarray(v, dtype=np.float64) / low) / ratio
+    return toValue, toFloat
+
+def linearScale(low, high):
+    span = high - low
+    toValue = lambda f: low + np.asarray(f, dtype=np.float64) * span
+    toFloat = lambda v: (np.asarray(v, dtype=np.float64) - low) / span
+    return toValue, toFloat
+
+def asScalar(result):
+    return float(result) if np.ndim(result) == 0 else result
+
+class ParameterMap:
+    """ Exact X32 float <-> value law for one parameter, snapped to the console's step grid, with the
+    matching Data.py table as a fallback """
+
+    def __init__(self, name, toValue, toFloat, steps, minValue, maxValue, fallback=None):
+        self.name = name
+        self.forward = toValue
+        self.inverse = toFloat
+        self.steps = steps
+        self.minValue = minValue
+        self.maxValue = maxValue
+        self.fallbackName = fallback  # attribute of quantizers.py, only imported if the table is needed
+
+    def fallback(self):
+        return getattr(importlib.import_module('quantizers'), self.fallbackName)
+
+    def useTable(self):
+        return not analyticMappings and self.fallbackName is not None
+
+    def snap(self, f):
+        lastStep = self.steps - 1
+        return np.round(np.clip(f, 0.0, 1.0) * lastStep) / lastStep
+
+    def toFloat(self, value):
+        if self.useTable():
+            table = self.fallback()
+            return table.nearestID(value) if np.ndim(value) == 0 else table.nearestIDs(value)
+        return asScalar(self.snap(self.inverse(np.clip(value, self.minValue, self.maxValue))))
+
+    def toValue(self, f):
+        return asScalar(self.forward(np.clip(f, 0.0, 1.0)))
+
+    def quantize(self, value):
+        # Nearest value the console can actually represent
+        return self.toValue(self.toFloat(value))
+
+faderMap = ParameterMap('fader', faderToDB, dbToFader, 1024, -90.0, 10.0, 'faderQuantizer')
+eqFreqMap = ParameterMap('eqFreq', *logScale(20.0, 20000.0), 201, 20.0, 20000.0, 'eqFreqQuantizer')
+lowcutMap = ParameterMap('lowcut', *logScale(20.0, 400.0), 101, 20.0, 400.0, 'lowcutQuantizer')
+qMap = ParameterMap('q', *logScale(10.0, 0.3), 72, 0.3, 10.0, 'qQuantizer')
+trimMap = ParameterMap('trim', *linearScale(-18.0, 18.0), 145, -18.0, 18.0, 'trimQuantizer')
+eqGainMap = ParameterMap('eqGain', *linearScale(-15.0, 15.0), 121, -15.0, 15.0, 'eqGainQuantizer')
+
+def keyPrecision(key):
+    # Half a unit in the last printed digit of a table key, e.g. 0.05 for "-9.6"
+    text = str(key)
+    decimals = len(text.split('.')[1]) if '.' in text else 0
+    return 0.5 * 10 ** -decimals
+
+def tableDeviations():
+    """ Compare every table entry with the analytic law; an entry is an outlier when it is more than one
+    console step away and its key also disagrees beyond its printed precision """
+    from Data import faderData, eqFreq, lowcutFreq, qValues, trimValues, eqGainValues
+    report = {}
+    for parameterMap, table in [(faderMap, faderData), (eqFreqMap, eqFreq), (lowcutMap, lowcutFreq),
+                                (qMap, qValues), (trimMap, trimValues), (eqGainMap, eqGainValues)]:
+        keys = np.array([float(key) for key in table.keys()])
+        ids = np.array(list(table.values()), dtype=np.float64)
+        precision = np.array([keyPrecision(key) for key in table.keys()])
+        stepDeviation = np.abs(parameterMap.inverse(keys) - ids) * (parameterMap.steps - 1)
+        valueDeviation = np.abs(parameterMap.forward(ids) - keys)
+        isOutlier = (stepDeviation > 1.0) & (valueDeviation > precision + 1e-9)
+        report[parameterMap.name] = {'entries': len(keys), 'maxSteps': float(stepDeviation.max()),
+                                     'outliers': [(float(key), float(ID)) for key, ID in zip(keys[isOutlier], ids[isOutlier])]}
+    return report
+
+if __name__ == "__main__":
+    for name, result in tableDeviations().items():
+        print(f"{name}: {result['entries']} entries, max deviation {result['maxSteps']:.2f} steps, "
+              f"{len(result['outliers'])} outliers {result['outliers'][:5]}")
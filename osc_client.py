@@ -0,0 +1,274 @@
+import struct
+import threading
+import time
+from collections import namedtuple
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+# Largest UDP payload that fits a 1500 byte Ethernet frame without IP fragmentation
+maxDatagramSize = 1472
+bundleHeader = b'#bundle\x00' + struct.pack('>Q', 1)  # time tag 1 means "immediately"
+sizePrefix = struct.Struct('>i')
+
+def buildMessage(address, value):
+    builder = OscMessageBuilder(address=address)
+    if value is None:
+        pass
+    elif isinstance(value, (list, tuple)):
+        for val in value:
+            builder.add_arg(val)
+    else:
+        builder.add_arg(value)
+    return builder.build()
+
+def oscPad(data):
+    # OSC strings are NUL terminated and padded to a multiple of 4 bytes
+    return data + b'\x00' * (4 - len(data) % 4)
+
+def asArgs(value):
+    return tuple(value) if isinstance(value, (list, tuple)) else (value,)
+
+class Datagram(namedtuple('Datagram', ['dgram'])):
+    """ Ready-made packet in the shape SimpleUDPClient.send expects """
+    __slots__ = ()
+
+class MessageTemplate:
+    """ One OSC address with its padded address and type tag encoded once; each send only patches the
+    argument bytes in place """
+
+    def __init__(self, address, typeTags):
+        self.address = address
+        self.header = oscPad(address.encode()) + oscPad((',' + typeTags).encode())
+        self.argFormat = struct.Struct('>' + typeTags)  # OSC 'i' and 'f' are big-endian int32/float32
+        self.size = len(self.header) + self.argFormat.size
+        self.dgram = bytearray(self.header) + bytearray(self.argFormat.size)
+
+    def encode(self, args):
+        # Reuses one buffer, so the packet is only valid until the next encode of this template
+        self.argFormat.pack_into(self.dgram, len(self.header), *args)
+        return self
+
+    def packInto(self, buffer, offset, args):
+        argsOffset = offset + len(self.header)
+        buffer[offset:argsOffset] = self.header
+        self.argFormat.pack_into(buffer, argsOffset, *args)
+
+class TemplateCache:
+    """ MessageTemplates for the hot channel addresses, keyed by (channel, parameter, band) and built on first use """
+    parameters = {
+        'fader': ('/ch/{channel:02}/mix/fader', 'f'),
+        'mute': ('/ch/{channel:02}/mix/on', 'i'),
+        'eqFreq': ('/ch/{channel:02}/eq/{band}/f', 'f'),
+        'eqGain': ('/ch/{channel:02}/eq/{band}/g', 'f'),
+        'eqQ': ('/ch/{channel:02}/eq/{band}/q', 'f'),
+        'eqType': ('/ch/{channel:02}/eq/{band}/type', 'i'),
+        'trim': ('/ch/{channel:02}/preamp/trim', 'f'),
+        'hpf': ('/ch/{channel:02}/preamp/hpf', 'f'),
+        'eq': ('/ch/{channel:02}/eq/{band}', 'ifff'),  # [type, freq, gain, q] in one message
+    }
+
+    def __init__(self):
+        self.templates = {}
+
+    def get(self, channel, parameter, band=None):
+        # channel is zero-based like everywhere else in the UI
+        key = (channel, parameter, band)
+        template = self.templates.get(key)
+        if template is None:
+            addressFormat, typeTags = self.parameters[parameter]
+            template = MessageTemplate(addressFormat.format(channel=channel + 1, band=band), typeTags)
+            self.templates[key] = template
+        return template
+
+templates = TemplateCache()
+
+class BundleBatch:
+    """ Collects the writes of one logical step and packs them into as few MTU-sized bundles as possible """
+
+    def __init__(self, sender, maxSize=maxDatagramSize):
+        self.sender = sender
+        self.maxSize = maxSize
+        self.entries = []  # (address, size, template or encoded message bytes, args)
+        self.bundleSizes = []  # messages packed into each datagram once the batch is closed
+
+    def send_message(self, address, value):
+        message = buildMessage(address, value)
+        self.entries.append((address, message.size, message.dgram, None))
+
+    def sendParameter(self, channel, parameter, value, band=None):
+        template = templates.get(channel, parameter, band)
+        self.entries.append((template.address, template.size, template, asArgs(value)))
+
+    def pack(self):
+        groups, group, size = [], [], len(bundleHeader)
+        for entry in self.entries:
+            entrySize = sizePrefix.size + entry[1]
+            if group and size + entrySize > self.maxSize:
+                groups.append(group)
+                group, size = [], len(bundleHeader)
+            group.append(entry)
+            size += entrySize
+        if group:
+            groups.append(group)
+
+        datagrams = []
+        for group in groups:
+            if len(bundleHeader) + sizePrefix.size + group[0][1] > self.maxSize:
+                # Too big to share a bundle, goes out as a plain message
+                _, _, message, args = group[0]
+                datagrams.append(Datagram(bytes(message.encode(args).dgram) if args is not None else message))
+                self.bundleSizes.append(1)
+                continue
+            buffer = bytearray(len(bundleHeader) + sum(sizePrefix.size + entry[1] for entry in group))
+            buffer[:len(bundleHeader)] = bundleHeader
+            offset = len(bundleHeader)
+            for _, entrySize, message, args in group:
+                sizePrefix.pack_into(buffer, offset, entrySize)
+                offset += sizePrefix.size
+                if args is None:
+                    buffer[offset:offset + entrySize] = message
+                else:
+                    message.packInto(buffer, offset, args)
+                offset += entrySize
+            datagrams.append(Datagram(bytes(buffer)))
+            self.bundleSizes.append(len(group))
+        return datagrams
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, traceback):
+        if excType is None and self.entries:
+            self.sender.sendDatagrams(self.pack(), {entry[0] for entry in self.entries}, self.bundleSizes)
+        return False
+
+class CoalescingSender:
+    """ Outbound OSC on its own thread with one slot per address: only the newest value for each address is
+    sent, at most maxRate times a second, so callers on the Qt thread never wait on the socket """
+
+    def __init__(self, client=None, maxRate=30.0):
+        self.client = client
+        self.interval = 1.0 / maxRate
+        self.pending = {}  # address: (template or None, newest unsent value)
+        self.datagrams = []  # (bundle, message count) from batch(), sent in order and never coalesced
+        self.lastBundleSizes = []
+        self.bundlesSent = 0
+        self.lastSentTime = {}  # address: time.monotonic() of its last send
+        self.flushAll = False
+        self.flushAddresses = set()
+        self.queued = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.dropped = 0
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def setClient(self, client):
+        with self.condition:
+            self.client = client
+            self.condition.notify()
+
+    def send_message(self, address, value):
+        # Same call as SimpleUDPClient.send_message, but returns as soon as the value is stored
+        self.queue(address, None, value)
+
+    def sendParameter(self, channel, parameter, value, band=None):
+        # Like send_message for the addresses in TemplateCache.parameters, without re-encoding the address
+        template = templates.get(channel, parameter, band)
+        self.queue(template.address, template, asArgs(value))
+
+    def queue(self, address, template, value):
+        with self.condition:
+            self.queued += 1
+            if address in self.pending:
+                self.coalesced += 1
+            self.pending[address] = (template, value)
+            self.condition.notify()
+
+    def batch(self, maxSize=maxDatagramSize):
+        # with sender.batch() as batch: batch.send_message(...) -- everything goes out as bundles on exit
+        return BundleBatch(self, maxSize)
+
+    def sendDatagrams(self, datagrams, addresses, bundleSizes):
+        with self.condition:
+            for address in addresses:
+                self.pending.pop(address, None)  # an older unsent value must not land after the batch
+            self.datagrams.extend(zip(datagrams, bundleSizes))
+            self.queued += sum(bundleSizes)
+            self.lastBundleSizes = list(bundleSizes)
+            self.condition.notify()
+
+    def flush(self, address=None):
+        # Sends the pending value(s) straight away, ignoring maxRate, e.g. when a fader is released
+        with self.condition:
+            if address is None:
+                self.flushAll = True
+            else:
+                self.flushAddresses.add(address)
+            self.condition.notify()
+
+    def takeDue(self, now):
+        # Called with the lock held; returns the messages to send now and how long to wait for the next one
+        due = []
+        nextDue = None
+        for address in list(self.pending):
+            readyAt = self.lastSentTime.get(address, 0.0) + self.interval
+            if readyAt <= now or self.flushAll or address in self.flushAddresses:
+                due.append((address, self.pending.pop(address)))
+                self.lastSentTime[address] = now
+            else:
+                nextDue = readyAt if nextDue is None else min(nextDue, readyAt)
+        self.flushAll = False
+        self.flushAddresses.clear()
+        return due, None if nextDue is None else nextDue - now
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.running and not self.pending and not self.datagrams:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                datagrams, self.datagrams = self.datagrams, []
+                due, wait = self.takeDue(time.monotonic())
+                client = self.client
+                if not due and not datagrams:
+                    self.condition.wait(wait)
+                    continue
+            for datagram, count in datagrams:
+                if client is None:
+                    self.dropped += count
+                    continue
+                try:
+                    client.send(datagram)
+                    self.bundlesSent += 1
+                    self.sent += count
+                except OSError as e:
+                    self.dropped += count
+                    print(f"Error sending {len(datagram.dgram)} byte bundle: {e}")
+            for address, (template, value) in due:
+                if client is None:
+                    self.dropped += 1
+                    continue
+                try:
+                    if template is None:
+                        client.send_message(address, value)
+                    else:
+                        client.send(template.encode(value))  # templates are only encoded on this thread
+                    self.sent += 1
+                except OSError as e:
+                    self.dropped += 1
+                    print(f"Error sending {address}: {e}")
+
+    def stats(self):
+        with self.condition:
+            return {'queued': self.queued, 'coalesced': self.coalesced, 'sent': self.sent,
+                    'dropped': self.dropped, 'pending': len(self.pending), 'bundles': self.bundlesSent,
+                    'lastBundleSizes': list(self.lastBundleSizes)}
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join(1.0)
@@ -1,9 +1,22 @@
-import struct
+import numpy as np
 
-from Data import frequencies, dataRTA, gainOffset, queueRTA
+from mappings import faderMap, trimMap
+from Data import frequencies, dataRTA, channelsRTA, gainOffset, mailboxRTA, spectrogramRTA
 
 receivedFirstRTA = False
 
+# /meters/15 blob layout: one leading int32 (value count) followed by pairs of
+# little-endian int16 values in 1/256 dB, one per RTA bin
+rtaHeaderShorts = 2
+rtaScale = np.float32(1.0 / 256.0)
+
+def decodeRTABlob(blobRTA):
+    shorts = np.frombuffer(blobRTA, dtype='<i2', count=(len(blobRTA) // 4) * 2)
+    binShorts = shorts[rtaHeaderShorts:rtaHeaderShorts + len(frequencies)]
+    if len(binShorts) < len(frequencies):
+        raise ValueError(f"RTA blob too short: {len(binShorts)} of {len(frequencies)} bins")
+    return binShorts * rtaScale + np.float32(gainOffset)
+
 # Class definitions
 class RTASubscriber:
     def __init__(self, client):
@@ -21,35 +34,16 @@ class RTASubscriber:
             print(f"No RTA data received on {address}")
             return
 
-        blobRTA = args[0]
-        dataPoints = len(blobRTA) // 4
-
         try:
-            ints = struct.unpack(f'<{dataPoints}I', blobRTA)
-            dbValues = []
-            for intValue in ints:
-                shortINT1 = intValue & 0xFFFF
-                shortINT2 = (intValue >> 16) & 0xFFFF
-                if shortINT1 >= 0x8000: shortINT1 -= 0x10000
-                if shortINT2 >= 0x8000: shortINT2 -= 0x10000
-                dbValue1 = (shortINT1 / 256.0) + gainOffset
-                dbValue2 = (shortINT2 / 256.0) + gainOffset
-                dbValues.append(dbValue1)
-                dbValues.append(dbValue2)
-
-            for i, dbValue in enumerate(dbValues[2:len(frequencies) + 2]):
-                freqLabel = frequencies[i] if i < len(frequencies) else "Unknown"
-                if freqLabel in dataRTA:
-                    dataRTA[freqLabel].append(dbValue)
-                    if len(dataRTA[freqLabel]) > 10:
-                        dataRTA[freqLabel].pop(0)
-                else:
-                    dataRTA[freqLabel] = [dbValue]
+            dbValues = decodeRTABlob(args[0])
+            dataRTA.push(dbValues)
+            channelsRTA.push(dbValues)
+            spectrogramRTA.push(dbValues)
 
             if not receivedFirstRTA:
                 receivedFirstRTA = True
 
-            queueRTA.put(dataRTA)
+            mailboxRTA.put(dbValues)
         except Exception as e:
             print(f"Error processing RTA data: {e}")
 
@@ -57,28 +51,17 @@ class OscHandlers:
     def handlerFader(self, address, *args):
         if args and isinstance(args[0], float):
             f = args[0]
-            if f > 0.75:
-                d = f * 40.0 - 30.0
-            elif f > 0.5:
-                d = f * 80.0 - 50.0
-            elif f > 0.25:
-                d = f * 160.0 - 70.0
-            elif f >= 0.0:
-                d = f * 480.0 - 90.0
-            else:
+            if not 0.0 <= f <= 1.0:
                 print(f"Invalid fader value: {f}")
                 return
+            d = faderMap.toValue(f)
             print(f"[{address}] ~ Fader value: {d:.2f} dB")
         else:
             print(f"[{address}] ~ Incorrect argument format or length. ARGS: {args}")
 
     def floatToDB(self, trimFloat):
-        floatMin = 0.0
-        floatMax = 0.25
-        dbMin = -18.0
-        dbMax = 18.0
-        if 0 <= trimFloat <= 0.25:
-            dbValue = (trimFloat - floatMin) * (dbMax - dbMin) / (floatMax - floatMin) + dbMin
+        if 0 <= trimFloat <= 1:
+            dbValue = trimMap.toValue(trimFloat)
         else:
             dbValue = "Out of range"
         return dbValue
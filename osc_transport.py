@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from PyQt6.QtCore import QThread, pyqtSignal
+from pythonosc.dispatcher import Dispatcher
+
+from osc_client import buildMessage
+from osc_handlers import OscHandlers
+
+class FastPathDispatcher(Dispatcher):
+    """ Dispatcher that passes single-blob messages on registered address prefixes straight to their
+    handler as a memoryview, skipping OscMessage parsing and pattern matching """
+
+    def __init__(self):
+        super().__init__()
+        self.blobRoutes = []
+        self.fastPathPackets = 0
+
+    def mapBlobFastPath(self, address, handler):
+        self.map(address, handler)  # messages that are not a lone blob still take the normal route
+        self.blobRoutes.append((address.encode(), address, handler))
+
+    def call_handlers_for_packet(self, data, client_address):
+        for prefix, address, handler in self.blobRoutes:
+            if data.startswith(prefix) and data[len(prefix):len(prefix) + 1] in (b'\x00', b'/'):
+                blob = self.extractBlob(data, len(prefix))
+                if blob is not None:
+                    self.fastPathPackets += 1
+                    handler(address, blob)
+                    return []
+        return super().call_handlers_for_packet(data, client_address)
+
+    @staticmethod
+    def extractBlob(data, searchStart):
+        addressEnd = data.find(b'\x00', searchStart)
+        if addressEnd < 0:
+            return None
+        typeTagStart = (addressEnd + 4) & ~3
+        if data[typeTagStart:typeTagStart + 4] != b',b\x00\x00':
+            return None
+        blobStart = typeTagStart + 8
+        blobSize = int.from_bytes(data[typeTagStart + 4:blobStart], 'big')
+        if blobStart + blobSize > len(data):
+            return None
+        return memoryview(data)[blobStart:blobStart + blobSize]
+
+class OSCDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, transportThread):
+        self.transportThread = transportThread
+
+    def datagram_received(self, data, addr):
+        self.transportThread.handleDatagram(data, addr)
+
+    def error_received(self, exc):
+        print(f"OSC transport error: {exc}")
+
+class AsyncOSCTransport(QThread):
+    """ Single asyncio event loop that receives and sends all OSC traffic on one UDP socket """
+    serverStarted = pyqtSignal()
+    xinfoReceived = pyqtSignal(str, str)  # mixer IP, "ip | name | model | version"
+    parameterReceived = pyqtSignal(str, list)  # parameter echoes and anything else no handler is mapped for
+
+    def __init__(self, dispatcher, listenAddress, mixerAddress):
+        super().__init__()
+        self.dispatcher = dispatcher
+        self.listenAddress = listenAddress
+        self.mixerAddress = mixerAddress
+        self.loop = None
+        self.transport = None
+        self.ready = threading.Event()
+        self.bindFinished = threading.Event()  # set once binding succeeded or failed, so callers need not wait out a timeout
+        self.dispatcher.set_default_handler(self.handlerParameter)
+
+    @property
+    def server_address(self):
+        return self.transport.get_extra_info('sockname') if self.transport else self.listenAddress
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.transport, _ = self.loop.run_until_complete(self.loop.create_datagram_endpoint(
+                lambda: OSCDatagramProtocol(self), local_addr=self.listenAddress))
+        except OSError as e:
+            print(f"Could not open OSC socket on {self.listenAddress}: {e}")
+            self.loop.close()
+            self.bindFinished.set()
+            return
+        self.ready.set()
+        self.bindFinished.set()
+        self.serverStarted.emit()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.ready.clear()
+            self.transport.close()
+            self.loop.run_until_complete(asyncio.sleep(0))
+            self.loop.close()
+
+    def handleDatagram(self, data, addr):
+        try:
+            if data.startswith(b'/xinfo'):
+                self.xinfoReceived.emit(addr[0], OscHandlers().handlerXInfo(data))
+            else:
+                self.dispatcher.call_handlers_for_packet(data, addr)
+        except Exception as e:
+            print(f"Error handling OSC packet from {addr[0]}: {e}")
+
+    def handlerParameter(self, address, *args):
+        self.parameterReceived.emit(address, list(args))
+
+    def send_message(self, address, value):
+        self.send(buildMessage(address, value).dgram)
+
+    def send(self, dgram, address=None):
+        # Safe to call from any thread; the datagram is written by the event loop thread.
+        # Accepts raw bytes or anything with a .dgram, like SimpleUDPClient.send. The bytes are copied
+        # because message templates reuse their buffer as soon as this returns
+        dgram = bytes(getattr(dgram, 'dgram', dgram))
+        if not self.ready.is_set():
+            print(f"OSC transport not ready, dropping {len(dgram)} byte packet")
+            return
+        self.loop.call_soon_threadsafe(self.transport.sendto, dgram, address or self.mixerAddress)
+
+    def stop(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.wait()
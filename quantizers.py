@@ -0,0 +1,105 @@
+import numpy as np
+
+from table_cache import loadTables, bandArrays
+from Data import frequencies
+
+class Quantizer:
+    """ Nearest-key lookup over a parameter table using sorted NumPy key/ID arrays and binary search """
+
+    def __init__(self, keys, ids, preferHigher=False, presorted=False):
+        keys = np.asarray(keys, dtype=np.float64)
+        ids = np.asarray(ids, dtype=np.float64)
+        if not presorted:
+            order = np.argsort(keys, kind='stable')
+            keys, ids = keys[order], ids[order]
+        self.keys = keys
+        self.ids = ids
+        self.lastIndex = len(self.keys) - 1
+        # A value exactly halfway between two keys goes to the lower key unless preferHigher is set
+        self.preferHigher = preferHigher
+
+    @classmethod
+    def fromCache(cls, tables, name):
+        return cls(tables[f'{name}_keys'], tables[f'{name}_ids'], bool(tables[f'{name}_preferHigher']), presorted=True)
+
+    def nearestIndex(self, value):
+        upper = min(max(int(np.searchsorted(self.keys, value)), 1), self.lastIndex)
+        if upper == 0:
+            return 0
+        lowerDistance = abs(self.keys[upper - 1] - value)
+        upperDistance = abs(self.keys[upper] - value)
+        if upperDistance < lowerDistance or (self.preferHigher and upperDistance == lowerDistance):
+            return upper
+        return upper - 1
+
+    def nearestIndices(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        upper = np.clip(np.searchsorted(self.keys, values), min(1, self.lastIndex), self.lastIndex)
+        lower = np.maximum(upper - 1, 0)
+        lowerDistance = np.abs(self.keys[lower] - values)
+        upperDistance = np.abs(self.keys[upper] - values)
+        pickUpper = upperDistance <= lowerDistance if self.preferHigher else upperDistance < lowerDistance
+        return np.where(pickUpper, upper, lower)
+
+    def nearest(self, value):
+        index = self.nearestIndex(value)
+        return float(self.keys[index]), float(self.ids[index])
+
+    def nearestKey(self, value):
+        return float(self.keys[self.nearestIndex(value)])
+
+    def nearestID(self, value):
+        return float(self.ids[self.nearestIndex(value)])
+
+    def nearestKeys(self, values):
+        return self.keys[self.nearestIndices(values)]
+
+    def nearestIDs(self, values):
+        return self.ids[self.nearestIndices(values)]
+
+    def minKey(self):
+        return float(self.keys[0])
+
+    def maxKey(self):
+        return float(self.keys[-1])
+
+tables = loadTables()
+faderQuantizer = Quantizer.fromCache(tables, 'faderData')
+eqFreqQuantizer = Quantizer.fromCache(tables, 'eqFreq')
+lowcutQuantizer = Quantizer.fromCache(tables, 'lowcutFreq')
+qQuantizer = Quantizer.fromCache(tables, 'qValues')
+trimQuantizer = Quantizer.fromCache(tables, 'trimValues')
+eqGainQuantizer = Quantizer.fromCache(tables, 'eqGainValues')
+
+# band_name: quantizer from target frequency in Hz to (freq, freq_id) within that band
+bandFreqQuantizers = {band: Quantizer(freqs, ids, presorted=True) for band, (freqs, ids) in bandArrays(tables).items()}
+
+class FrequencyIndex:
+    """ Nearest band EQ frequency ID for every RTA bin, worked out once, plus binary-search lookups for any Hz """
+
+    def __init__(self, freqs, bandQuantizers):
+        self.freqs = np.asarray(freqs, dtype=np.float64)
+        self.bandQuantizers = bandQuantizers
+        self.binIDs = {}
+        self.binFreqs = {}
+        for band, quantizer in bandQuantizers.items():
+            indices = quantizer.nearestIndices(self.freqs)
+            self.binIDs[band] = quantizer.ids[indices]
+            self.binFreqs[band] = quantizer.keys[indices]
+
+    def forBin(self, band, binIndex):
+        # binIndex may be an int or an array of bins
+        return self.binIDs[band][binIndex], self.binFreqs[band][binIndex]
+
+    def forFreq(self, band, freq):
+        nearestFreq, freqID = self.bandQuantizers[band].nearest(freq)
+        return freqID, nearestFreq
+
+    def nearestBin(self, freq):
+        # RTA bin closest to freq on a log scale, which is how the bins are spaced
+        upper = min(max(int(np.searchsorted(self.freqs, freq)), 1), len(self.freqs) - 1)
+        lower = upper - 1
+        return upper if abs(np.log(self.freqs[upper] / freq)) < abs(np.log(freq / self.freqs[lower])) else lower
+
+# band_name: RTA bin -> (freq_id, freq), shared by the auto-EQ and the UI frequency dial
+frequencyIndex = FrequencyIndex(frequencies, bandFreqQuantizers)
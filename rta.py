@@ -0,0 +1,295 @@
+import threading
+import time
+from collections import namedtuple
+import numpy as np
+
+class RTAHistory:
+    """ Fixed-size ring buffer of RTA frames, one row per frame and one column per bin """
+
+    def __init__(self, numBins, depth=10, fill=-90.0):
+        self.numBins = numBins
+        self.depth = depth
+        self.fill = fill
+        self.frames = np.full((depth, numBins), fill, dtype=np.float32)
+        self.writeIndex = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def push(self, dbValues):
+        with self.lock:
+            self.frames[self.writeIndex] = dbValues
+            self.writeIndex = (self.writeIndex + 1) % self.depth
+            self.count = min(self.count + 1, self.depth)
+
+    def clear(self):
+        with self.lock:
+            self.frames.fill(self.fill)
+            self.writeIndex = 0
+            self.count = 0
+
+    def isFull(self):
+        return self.count >= self.depth
+
+    def latest(self):
+        with self.lock:
+            return self.frames[(self.writeIndex - 1) % self.depth].copy()
+
+    def window(self, frames=None):
+        # Oldest to newest copy of the last `frames` rows; an empty history reads as one fill row
+        with self.lock:
+            available = max(self.count, 1)
+            n = available if frames is None else max(1, min(frames, available))
+            start = (self.writeIndex - n) % self.depth
+            if start + n <= self.depth:
+                return self.frames[start:start + n].copy()
+            return np.concatenate((self.frames[start:], self.frames[:self.writeIndex]))
+
+    def windowMax(self, frames=None):
+        return self.window(frames).max(axis=0)
+
+    def windowMin(self, frames=None):
+        return self.window(frames).min(axis=0)
+
+    def windowMean(self, frames=None):
+        return self.window(frames).mean(axis=0)
+
+class ChannelRTAHistory:
+    """ Ring buffers of RTA frames for every channel stacked into one (channels, depth, bins) array.
+    Frames are written to whichever channel is currently the console's RTA source """
+
+    def __init__(self, numChannels, numBins, depth=10, fill=-90.0):
+        self.numChannels = numChannels
+        self.depth = depth
+        self.fill = fill
+        self.frames = np.full((numChannels, depth, numBins), fill, dtype=np.float32)
+        self.writeIndex = np.zeros(numChannels, dtype=np.int64)
+        self.count = np.zeros(numChannels, dtype=np.int64)
+        self.activeChannel = None
+        self.activeFrames = 0  # frames stored for activeChannel since it became the source
+        self.skipFrames = 0
+        self.lock = threading.Lock()
+
+    def setActiveChannel(self, channel, settleFrames=0):
+        # The first frames after a source change can still belong to the previous channel
+        with self.lock:
+            self.activeChannel = channel
+            self.activeFrames = 0
+            self.skipFrames = settleFrames
+
+    def push(self, dbValues):
+        with self.lock:
+            channel = self.activeChannel
+            if channel is None:
+                return
+            if self.skipFrames > 0:
+                self.skipFrames -= 1
+                return
+            self.frames[channel, self.writeIndex[channel]] = dbValues
+            self.writeIndex[channel] = (self.writeIndex[channel] + 1) % self.depth
+            self.count[channel] = min(self.count[channel] + 1, self.depth)
+            self.activeFrames += 1
+
+    def clear(self, channel=None):
+        with self.lock:
+            channels = slice(None) if channel is None else channel
+            self.frames[channels] = self.fill
+            self.writeIndex[channels] = 0
+            self.count[channels] = 0
+
+    def isFull(self, channel):
+        return self.count[channel] >= self.depth
+
+    def fullChannels(self, channels):
+        channels = np.asarray(channels, dtype=np.int64)
+        return channels[self.count[channels] >= self.depth]
+
+    def window(self, channels):
+        # (len(channels), depth, bins) copy, each channel ordered oldest to newest
+        channels = np.asarray(channels, dtype=np.int64)
+        with self.lock:
+            rows = (self.writeIndex[channels, None] + np.arange(self.depth)) % self.depth
+            return self.frames[channels[:, None], rows]
+
+class RTAFrame(namedtuple('RTAFrame', ['version', 'timestamp', 'values'])):
+    """ Immutable, versioned snapshot of one decoded RTA frame """
+    __slots__ = ()
+
+class RTAMailbox:
+    """ Latest-value-wins slot for RTA frames; older unread frames are overwritten, never queued """
+
+    def __init__(self):
+        self.frame = None
+        self.frameRead = True
+        self.woken = False
+        self.produced = 0
+        self.consumed = 0
+        self.overwritten = 0
+        self.lock = threading.Lock()
+        self.newFrame = threading.Condition(self.lock)
+
+    def put(self, dbValues):
+        values = np.array(dbValues, dtype=np.float32)
+        values.flags.writeable = False
+        with self.lock:
+            self.produced += 1
+            if not self.frameRead:
+                self.overwritten += 1
+            self.frame = RTAFrame(self.produced, time.monotonic(), values)
+            self.frameRead = False
+            self.newFrame.notify_all()
+            return self.frame
+
+    def get(self, sinceVersion=0):
+        # Newest frame if it is newer than sinceVersion, otherwise None
+        with self.lock:
+            frame = self.frame
+            if frame is None or frame.version <= sinceVersion:
+                return None
+            if not self.frameRead:
+                self.frameRead = True
+                self.consumed += 1
+            return frame
+
+    def latestVersion(self):
+        frame = self.frame
+        return frame.version if frame is not None else 0
+
+    def waitForNewer(self, version, timeout=None):
+        # Blocks until a frame newer than `version` arrives, the timeout passes or wake() is called.
+        # Returns the latest version without consuming the frame, so other readers still see it.
+        with self.lock:
+            self.newFrame.wait_for(lambda: self.frame is not None and self.frame.version > version or self.woken, timeout)
+            self.woken = False
+            return self.frame.version if self.frame is not None else 0
+
+    def wake(self):
+        # Releases threads blocked in waitForNewer, e.g. when their loop is being stopped
+        with self.lock:
+            self.woken = True
+            self.newFrame.notify_all()
+
+    def stats(self):
+        with self.lock:
+            return {'produced': self.produced, 'consumed': self.consumed, 'overwritten': self.overwritten}
+
+class SpectrogramBuffer:
+    """ Circular uint8 image of the most recent RTA frames, one row per frame, for the waterfall view """
+
+    def __init__(self, numBins, rows, floorDB=-90.0, ceilDB=0.0):
+        self.numBins = numBins
+        self.rows = rows
+        self.floorDB = floorDB
+        self.scale = 255.0 / (ceilDB - floorDB)
+        # Every row is written twice so the last `rows` frames are always one contiguous slice
+        self.image = np.zeros((rows * 2, numBins), dtype=np.uint8)
+        self.scratch = np.empty(numBins, dtype=np.float32)
+        self.writeIndex = 0
+        self.count = 0
+        self.lock = threading.Lock()  # push runs on the OSC thread, snapshot on the Qt thread
+
+    def push(self, dbValues):
+        with self.lock:
+            np.subtract(dbValues, self.floorDB, out=self.scratch)
+            np.multiply(self.scratch, self.scale, out=self.scratch)
+            np.clip(self.scratch, 0, 255, out=self.scratch)
+            self.image[self.writeIndex] = self.scratch
+            self.image[self.writeIndex + self.rows] = self.scratch
+            self.writeIndex = (self.writeIndex + 1) % self.rows
+            self.count += 1
+
+    def snapshot(self):
+        # Oldest to newest, copied under the lock so a push can't tear the image while it is drawn
+        with self.lock:
+            return self.image[self.writeIndex:self.writeIndex + self.rows].copy(), self.count
+
+class SpectrumBallistics:
+    """ Attack/release smoothing and peak hold over whole RTA frames, timed by elapsed seconds rather than ticks """
+
+    def __init__(self, numBins, attackTime=0.01, releaseTime=0.35, peakHoldTime=1.5, peakDecayRate=20.0, floorDB=-90.0):
+        self.attackTime = attackTime
+        self.releaseTime = releaseTime
+        self.peakHoldTime = peakHoldTime
+        self.peakDecayRate = peakDecayRate  # dB per second once the hold time has passed
+        self.floorDB = floorDB
+        self.level = np.full(numBins, floorDB, dtype=np.float32)
+        self.peaks = np.full(numBins, floorDB, dtype=np.float32)
+        self.peakAge = np.zeros(numBins, dtype=np.float32)
+        self.lastTime = None
+
+    def smoothing(self, timeConstant, elapsed):
+        if timeConstant <= 0:
+            return 1.0
+        return 1.0 - np.exp(-elapsed / timeConstant)
+
+    def update(self, dbValues, timestamp, peakValues=None):
+        # peakValues lets callers feed the max of frames that arrived between two updates
+        elapsed = 0.0 if self.lastTime is None else max(timestamp - self.lastTime, 0.0)
+        self.lastTime = timestamp
+        if elapsed == 0.0:
+            self.level[:] = dbValues
+        else:
+            coeff = np.where(dbValues > self.level, self.smoothing(self.attackTime, elapsed),
+                             self.smoothing(self.releaseTime, elapsed)).astype(np.float32)
+            self.level += (dbValues - self.level) * coeff
+
+        peakInput = np.maximum(self.level, peakValues) if peakValues is not None else self.level
+        self.peakAge += elapsed
+        newPeaks = peakInput >= self.peaks
+        self.peaks[newPeaks] = peakInput[newPeaks]
+        self.peakAge[newPeaks] = 0.0
+        expired = self.peakAge > self.peakHoldTime
+        decayed = np.maximum(self.peaks - self.peakDecayRate * elapsed, peakInput)
+        self.peaks[expired] = decayed[expired]
+        return self.level, self.peaks
+
+    def reset(self):
+        self.level.fill(self.floorDB)
+        self.peaks.fill(self.floorDB)
+        self.peakAge.fill(0.0)
+        self.lastTime = None
+
+BandStats = namedtuple('BandStats', ['maxDB', 'minDB', 'maxBin', 'minBin', 'floorMinDB'])
+
+class BandStatistics:
+    """ Max/min statistics for every band in one pass over an RTA history window """
+
+    def __init__(self, freqs, bandRanges, floorDB=-60.0):
+        # freqs is sorted, so each band is a contiguous slice of bins worked out once here
+        self.freqs = np.asarray(freqs)
+        self.bandNames = list(bandRanges)
+        self.floorDB = floorDB
+        self.slices = {}
+        for band, (lowBound, upBound) in bandRanges.items():
+            start = int(np.searchsorted(self.freqs, lowBound, side='left'))
+            stop = int(np.searchsorted(self.freqs, upBound, side='right'))
+            self.slices[band] = slice(start, stop)
+
+    def compute(self, window):
+        # window is (..., frames, bins); stacked channel windows give (..., bands) results per field
+        colMax = window.max(axis=-2)
+        colMin = window.min(axis=-2)
+        colFloorMin = np.where(window > self.floorDB, window, np.inf).min(axis=-2)
+        stats = {}
+        for band in self.bandNames:
+            bandSlice = self.slices[band]
+            if bandSlice.start >= bandSlice.stop:
+                continue
+            maxBin = colMax[..., bandSlice].argmax(axis=-1) + bandSlice.start
+            minBin = colMin[..., bandSlice].argmin(axis=-1) + bandSlice.start
+            floorMinDB = colFloorMin[..., bandSlice].min(axis=-1)
+            stats[band] = BandStats(np.take_along_axis(colMax, np.expand_dims(maxBin, -1), -1)[..., 0],
+                                    np.take_along_axis(colMin, np.expand_dims(minBin, -1), -1)[..., 0],
+                                    maxBin, minBin, np.where(np.isinf(floorMinDB), np.nan, floorMinDB))
+        return stats
+
+    def similarBinCount(self, window, band, refBin, tolerance=5.0):
+        # Number of bins in the band whose history comes within `tolerance` dB of refBin's peak at least once
+        bandSlice = self.slices[band]
+        refBin = np.asarray(refBin)
+        refMax = np.take_along_axis(window.max(axis=-2), np.expand_dims(refBin, -1), -1)
+        near = np.abs(window[..., bandSlice] - np.expand_dims(refMax, -2)) <= tolerance
+        return near.any(axis=-2).sum(axis=-1)
+
+    def bandSize(self, band):
+        bandSlice = self.slices[band]
+        return bandSlice.stop - bandSlice.start
@@ -0,0 +1,111 @@
+import hashlib
+import os
+import sys
+import zipfile
+import numpy as np
+
+cacheFileName = 'DataTables.npz'
+tableNames = ('faderData', 'eqFreq', 'lowcutFreq', 'qValues', 'trimValues', 'eqGainValues')
+cachedTables = None
+
+def baseDir():
+    # PyInstaller unpacks data files to sys._MEIPASS; from source the cache sits next to this file
+    return getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+def cachePath():
+    return os.path.join(baseDir(), cacheFileName)
+
+def sourcePath():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'DataTables.py')
+
+def sourceDigest():
+    # Covers DataTables.py and the Data.bandRanges packed into the band arrays. None in a frozen build,
+    # where DataTables.py is not shipped and the cache is trusted as built
+    try:
+        with open(sourcePath(), 'rb') as f:
+            digest = hashlib.sha1(f.read())
+    except OSError:
+        return None
+    from Data import bandRanges
+    digest.update(repr(bandRanges).encode())
+    return digest.hexdigest()
+
+def sortedArrays(table):
+    # Sorted once at compile time; ties resolve like min() over the table: to whichever key comes first in it
+    keys = np.array([float(key) for key in table.keys()], dtype=np.float64)
+    ids = np.array(list(table.values()), dtype=np.float64)
+    order = np.argsort(keys, kind='stable')
+    preferHigher = len(keys) > 1 and keys[0] > keys[-1]
+    return keys[order], ids[order], preferHigher
+
+def buildArrays():
+    import DataTables
+    from Data import bandRanges
+    arrays = {'sourceDigest': np.array(sourceDigest() or '')}
+    for name in tableNames:
+        keys, ids, preferHigher = sortedArrays(getattr(DataTables, name))
+        arrays[f'{name}_keys'] = keys
+        arrays[f'{name}_ids'] = ids
+        arrays[f'{name}_preferHigher'] = np.array(preferHigher)
+
+    # All bands packed into flat arrays, split again with bandOffsets
+    bandFreqs, bandIDs, bandOffsets = [], [], [0]
+    for freqs in bandRanges.values():
+        keys = np.array([freq for _, freq in freqs], dtype=np.float64)
+        order = np.argsort(keys, kind='stable')
+        bandFreqs.append(keys[order])
+        bandIDs.append(np.array([freqID for freqID, _ in freqs], dtype=np.float64)[order])
+        bandOffsets.append(bandOffsets[-1] + len(keys))
+    arrays['bandNames'] = np.array(list(bandRanges))
+    arrays['bandFreqs'] = np.concatenate(bandFreqs)
+    arrays['bandIDs'] = np.concatenate(bandIDs)
+    arrays['bandOffsets'] = np.array(bandOffsets, dtype=np.int64)
+    return arrays
+
+def compileTables(path=None):
+    path = path or cachePath()
+    arrays = buildArrays()
+    # Written beside the cache and swapped in, so an interrupted build never leaves a truncated file behind
+    tmpPath = path + '.tmp'
+    try:
+        with open(tmpPath, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmpPath, path)
+    except OSError:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        raise
+    return arrays
+
+def loadTables():
+    """ Sorted key/ID arrays for every parameter table, read from DataTables.npz on first call and
+    rebuilt from DataTables.py if the file is missing or older than the source tables """
+    global cachedTables
+    if cachedTables is not None:
+        return cachedTables
+    path = cachePath()
+    try:
+        with np.load(path, allow_pickle=False) as cache:
+            arrays = {name: cache[name] for name in cache.files}
+        digest = sourceDigest()
+        if digest is not None and str(arrays['sourceDigest']) != digest:
+            raise ValueError("stale table cache")
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print(f"Rebuilding {cacheFileName}: {e}")
+        try:
+            arrays = compileTables(path)
+        except OSError as e:
+            print(f"Could not write {cacheFileName}: {e}")
+            arrays = buildArrays()
+    cachedTables = arrays
+    return cachedTables
+
+def bandArrays(tables):
+    # band_name: (sorted freqs, matching freq IDs)
+    offsets = tables['bandOffsets']
+    return {str(band): (tables['bandFreqs'][offsets[i]:offsets[i + 1]], tables['bandIDs'][offsets[i]:offsets[i + 1]])
+            for i, band in enumerate(tables['bandNames'])}
+
+if __name__ == "__main__":
+    compileTables()
+    print(f"Wrote {cachePath()}")
@@ -10,8 +10,11 @@ import threading
 import time
 from pythonosc.udp_client import SimpleUDPClient
 
-from utils import MixerDiscovery, PlotManager, BandManager
-from Data import faderData, eqGainValues, lowcutFreq, eqFreq, qValues, trimValues
+from osc_client import CoalescingSender, templates
+from utils import MixerDiscovery, PlotManager, BandManager, MultiChannelBandManager
+from Data import mailboxRTA, frequencies
+from quantizers import frequencyIndex
+from mappings import faderMap, eqFreqMap, lowcutMap, qMap, trimMap, eqGainMap
 import logging
 
 logging.basicConfig(level=logging.DEBUG)
@@ -32,14 +35,15 @@ def widgetShadow(widget, shadowRadius=15, xOffset=3, yOffset=3, color=QColor(0,
     widget.setGraphicsEffect(shadow)
 
 class MixerDiscoveryWorker(QThread):
-    mixersFound = pyqtSignal(dict)
+    mixerFound = pyqtSignal(str, str)  # emitted as soon as each console answers
+    mixersFound = pyqtSignal(dict)  # emitted once the scan is over, with everything that answered
 
     def __init__(self):
         super().__init__()
         self.mixerScanner = MixerDiscovery()
 
     def run(self):
-        availableMixers = self.mixerScanner.discoverMixers()
+        availableMixers = self.mixerScanner.discoverMixers(onMixerFound=self.mixerFound.emit)
         self.mixersFound.emit(availableMixers)
 
 class MixerDiscoveryUI(QDialog):
@@ -48,9 +52,11 @@ class MixerDiscoveryUI(QDialog):
         self.setWindowTitle("Mixer Discovery")
         self.setWindowIcon(QIcon(rPath("AudioPilot_Logo2.png")))
         self.setGeometry(100, 100, 400, 200)
+        self.mixerRows = 0
         self.initUI()
         self.mixerWorker = MixerDiscoveryWorker()
-        self.mixerWorker.mixersFound.connect(self.updateMixerGrid)
+        self.mixerWorker.mixerFound.connect(self.updateMixerGrid)
+        self.mixerWorker.mixersFound.connect(self.scanFinished)
         self.mixerWorker.start()
 
     def initUI(self):
@@ -75,31 +81,38 @@ class MixerDiscoveryUI(QDialog):
             self.setStyleSheet(f.read())
 
     def searchAgain(self):
+        if self.mixerWorker.isRunning():
+            return
+        self.clearMixerGrid()
         self.infoLabel.setText("Searching for mixers...")
         self.mixerWorker.start()
 
-    @pyqtSlot(dict)
-    def updateMixerGrid(self, availableMixers):
-        for i in reversed(range(self.mixerGridLayout.count())): 
+    def clearMixerGrid(self):
+        for i in reversed(range(self.mixerGridLayout.count())):
             widget = self.mixerGridLayout.itemAt(i).widget()
             if widget:
                 widget.deleteLater()
+        self.mixerRows = 0
+
+    @pyqtSlot(str, str)
+    def updateMixerGrid(self, ip, details):
+        # Adds one row per console while the scan is still running
+        self.infoLabel.setText("Select a mixer from the list below:")
+        parts = details.split('|')
+        name = parts[1].strip() if len(parts) > 1 else details
+        mixerLabel = QLabel(f"Mixer at {ip} - {details}")
+        mixerLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        mixerButton = QPushButton("Select")
+        mixerButton.clicked.connect(lambda _, ip=ip, name=name: self.chooseMixer(ip, name))
+        widgetShadow(mixerButton)  # Apply shadow effect
+        self.mixerGridLayout.addWidget(mixerLabel, self.mixerRows, 0, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.mixerGridLayout.addWidget(mixerButton, self.mixerRows, 1)
+        self.mixerRows += 1
 
+    @pyqtSlot(dict)
+    def scanFinished(self, availableMixers):
         if not availableMixers:
             self.infoLabel.setText("No mixers found.")
-        else:
-            self.infoLabel.setText("Select a mixer from the list below:")
-
-        row = 0
-        for ip, details in availableMixers.items():
-            mixerLabel = QLabel(f"Mixer at {ip} - {details}")
-            mixerLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            mixerButton = QPushButton("Select")
-            mixerButton.clicked.connect(lambda _, ip=ip, name=details.split('|')[1].strip(): self.chooseMixer(ip, name))
-            widgetShadow(mixerButton)  # Apply shadow effect
-            self.mixerGridLayout.addWidget(mixerLabel, row, 0, alignment=Qt.AlignmentFlag.AlignCenter)
-            self.mixerGridLayout.addWidget(mixerButton, row, 1)
-            row += 1
 
     def chooseMixer(self, ip, name):
         self.selectedMixerIp = ip
@@ -115,9 +128,8 @@ class CustomFader(QSlider):
         self.channelNumber = channelNumber
         self.scaleFactor = 100  # Scale factor to convert float to int
         self.precisionLevel = 1.5  # Default precision factor
-        self.adjustedKeys = [float(key) for key in faderData.keys()]
-        self.minVal = min(map(lambda x: int(x * self.scaleFactor), self.adjustedKeys))
-        self.maxVal = max(map(lambda x: int(x * self.scaleFactor), self.adjustedKeys))
+        self.minVal = int(faderMap.minValue * self.scaleFactor)
+        self.maxVal = int(faderMap.maxValue * self.scaleFactor)
         self.setRange(self.minVal, self.maxVal)
         self.setValue(0)
         self.valueChanged.connect(self.sendOscMessage)
@@ -164,13 +176,11 @@ class CustomFader(QSlider):
 
     def sendOscMessage(self):
         scaledDbValue = self.value() / self.scaleFactor
-        closestKey = min(self.adjustedKeys, key=lambda x: abs(x - scaledDbValue))
-        oscFloatID = faderData.get(str(closestKey), None)
+        oscFloatID = faderMap.toFloat(scaledDbValue)
         if oscFloatID is not None and self.channelNumber is not None:
-            channelNumberFormatted = f"{self.channelNumber+1:02}"  # Format channel_num as two-digit
-            self.client.send_message(f'/ch/{channelNumberFormatted}/mix/fader', [oscFloatID])
+            self.client.sendParameter(self.channelNumber, 'fader', oscFloatID)
             self.valueChangedSignal.emit(oscFloatID)
-            logging.debug(f'Sent OSC message: /ch/{channelNumberFormatted}/mix/fader {oscFloatID}')
+            logging.debug(f'Sent OSC message: /ch/{self.channelNumber+1:02}/mix/fader {oscFloatID}')
 
     def wheelEvent(self, event):
         steps = event.angleDelta().y() / 120
@@ -180,6 +190,11 @@ class CustomFader(QSlider):
             self.setValue(updatedValue)
             self.sendOscMessage()  # Send OSC message when scrolling
 
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self.channelNumber is not None:
+            self.client.flush(templates.get(self.channelNumber, 'fader').address)  # The resting value goes out without waiting
+
     def mouseMoveEvent(self, event):
         if event.buttons() == Qt.MouseButton.LeftButton:
             scaledValue = self.minimum() + ((self.maximum() - self.minimum()) * (self.height() - event.position().y()) / self.height())
@@ -189,18 +204,31 @@ class CustomFader(QSlider):
                 self.sendOscMessage()  # Send OSC message when dragging
 
 class AudioPilotUI(QWidget):
-    def __init__(self, mixerName, client):
+    def __init__(self, mixerName, client, bandMinInterval=0.1, bandIdleTimeout=1.0, maxSendRate=30.0):
         super().__init__()
         self.mixerName = mixerName
-        self.client = client
+        self.oscSender = CoalescingSender(client, maxRate=maxSendRate)
         self.plotMgr = None
         self.channelNum = None
         self.bandManagerThread = None
         self.bandThreadRunning = threading.Event()
+        self.bandMinInterval = bandMinInterval  # seconds between auto-EQ updates, however fast frames arrive
+        self.bandIdleTimeout = bandIdleTimeout  # longest the auto-EQ thread sleeps before rechecking it should run
+        self.autoEQChannels = {}  # channel: vocal type, for the multi-channel auto-EQ
+        self.multiBandMgr = None
         self.isMuted = True  # Initial state is muted
         self.selectedBand = 1  # Default to the first band
         self.initUI()
 
+    @property
+    def client(self):
+        # Everything in the UI sends through the coalescing sender; assigning a client retargets it
+        return self.oscSender
+
+    @client.setter
+    def client(self, client):
+        self.oscSender.setClient(client)
+
     def initUI(self):
         self.setWindowTitle('Audio Pilot')
         self.setWindowIcon(QIcon(rPath("AudioPilot_Logo2.png")))
@@ -256,6 +284,12 @@ class AudioPilotUI(QWidget):
         widgetShadow(self.selectChannelButton)  # Apply shadow effect
         leftPanelLayout.addWidget(self.selectChannelButton)
 
+        # Multi-channel Auto-EQ Selector
+        self.autoEQChannelsButton = QPushButton("Auto-EQ Set")
+        self.autoEQChannelsButton.clicked.connect(self.showAutoEQChannelSelector)
+        widgetShadow(self.autoEQChannelsButton)  # Apply shadow effect
+        leftPanelLayout.addWidget(self.autoEQChannelsButton)
+
         topLayout.addLayout(leftPanelLayout)
 
         # RTA Plot
@@ -266,6 +300,9 @@ class AudioPilotUI(QWidget):
         self.plot.setLabel('bottom', 'Frequency', units='Hz')
         self.plot.setLabel('left', 'dB')
         self.plot.showGrid(x=True, y=True)
+        self.graphWidget.nextRow()
+        self.waterfallPlot = self.graphWidget.addPlot(title="")
+        self.waterfallPlot.setMouseEnabled(x=False, y=False)
         topLayout.addWidget(self.graphWidget)
 
         eqControls = QVBoxLayout()
@@ -317,8 +354,9 @@ class AudioPilotUI(QWidget):
         trimLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
         trimLayout.addWidget(trimLabel, alignment=Qt.AlignmentFlag.AlignCenter)
         self.trimDial = QDial()
+        self.trimDial.sliderReleased.connect(self.oscSender.flush)
         self.trimDial.setFixedSize(100, 100)
-        self.trimDial.setRange(int(min(trimValues.keys())), int(max(trimValues.keys())))
+        self.trimDial.setRange(int(trimMap.minValue), int(trimMap.maxValue))
         self.trimDial.setValue(0)
         self.trimDial.valueChanged.connect(self.changeTrim)
         widgetShadow(self.trimDial)  # Apply shadow effect
@@ -390,7 +428,8 @@ class AudioPilotUI(QWidget):
         
         # Low Cut Dial
         self.lowcutDial = QDial()
-        self.lowcutDial.setRange(int(min(lowcutFreq.keys())), int(max(lowcutFreq.keys())))
+        self.lowcutDial.sliderReleased.connect(self.oscSender.flush)
+        self.lowcutDial.setRange(int(lowcutMap.minValue), int(lowcutMap.maxValue))
         self.lowcutDial.setValue(100)
         self.lowcutDial.setFixedSize(80, 80)  # Decrease size of the lowcut dial
         self.lowcutDial.valueChanged.connect(self.changeLowCut)
@@ -405,7 +444,8 @@ class AudioPilotUI(QWidget):
         freqLabel = QLabel("Frequency")
         freqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.freqDial = QDial()
-        self.freqDial.setRange(int(min(map(float, eqFreq.keys()))), int(max(map(float, eqFreq.keys()))))
+        self.freqDial.sliderReleased.connect(self.oscSender.flush)
+        self.freqDial.setRange(int(eqFreqMap.minValue), int(eqFreqMap.maxValue))
         self.freqDial.setValue(1000)
         self.freqDial.setFixedSize(80, 80)
         self.freqDial.valueChanged.connect(self.changeFreq)
@@ -420,7 +460,8 @@ class AudioPilotUI(QWidget):
         qLabel = QLabel("Quality")
         qLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.qDial = QDial()
-        self.qDial.setRange(int(min(qValues.keys())), int(max(qValues.keys())))
+        self.qDial.sliderReleased.connect(self.oscSender.flush)
+        self.qDial.setRange(int(qMap.minValue), int(qMap.maxValue))
         self.qDial.setValue(5)
         self.qDial.setFixedSize(80, 80)
         self.qDial.valueChanged.connect(self.changeQ)
@@ -435,7 +476,8 @@ class AudioPilotUI(QWidget):
         smallGainLabel = QLabel("Gain")
         smallGainLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.smallGainDial = QDial()
-        self.smallGainDial.setRange(int(min(eqGainValues.keys())), int(max(eqGainValues.keys())))
+        self.smallGainDial.sliderReleased.connect(self.oscSender.flush)
+        self.smallGainDial.setRange(int(eqGainMap.minValue), int(eqGainMap.maxValue))
         self.smallGainDial.setValue(0)
         self.smallGainDial.setFixedSize(80, 80)
         self.smallGainDial.valueChanged.connect(self.changeEqGain)
@@ -474,7 +516,7 @@ class AudioPilotUI(QWidget):
         
         eqModeId = index  # Since the index corresponds to the enum value 0..5
         channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
-        self.client.send_message(f'/ch/{channelNumFormatted}/eq/{self.selectedBand}/type', [eqModeId])
+        self.client.sendParameter(self.channelNum, 'eqType', eqModeId, band=self.selectedBand)
         print(f'Sent OSC message: /ch/{channelNumFormatted}/eq/{self.selectedBand}/type {eqModeId}')
 
     def toggleFineMode(self):
@@ -492,8 +534,8 @@ class AudioPilotUI(QWidget):
 
     def clearPlot(self):
         if self.plotMgr:
-            for bar in self.plotMgr.bars.values():
-                bar.clear()
+            self.plotMgr.clearPlot()
+        self.plot.setTitle("")
 
     def redrawPlot(self):
         if self.plotMgr:
@@ -504,33 +546,57 @@ class AudioPilotUI(QWidget):
         if self.channelSelectorDialog.exec() == QDialog.DialogCode.Accepted:
             self.selectChannelButton.setText(self.channelSelectorDialog.selectedChannel)
             self.channelNum = int(self.channelSelectorDialog.selectedChannel.split()[1]) - 1
-            self.client.send_message('/-action/setrtasrc', [self.channelNum])
+            if self.multiBandMgr is None:
+                self.client.send_message('/-action/setrtasrc', [self.channelNum])
+            else:
+                # The multi-channel auto-EQ owns the RTA source; stopBandManager hands it back to this channel
+                print(f"Auto-EQ is rotating the RTA source, channel {self.channelNum + 1} is shown once it stops")
             self.fader.channelNumber = self.channelNum  # Set channel number for fader
             self.startPlotting()
 
+    def showAutoEQChannelSelector(self):
+        dialog = ChannelSelectorDialog(self, multiSelect=True, selectedChannels=self.autoEQChannels)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            # Newly added channels take the currently selected vocal type, existing ones keep theirs
+            checkedButton = self.pitchButtonGroup.checkedButton()
+            vocalType = checkedButton.text() if checkedButton else "Low Pitch"
+            self.autoEQChannels = {channel: self.autoEQChannels.get(channel, vocalType) for channel in dialog.selectedChannels}
+            count = len(self.autoEQChannels)
+            self.autoEQChannelsButton.setText(f"Auto-EQ: {count} ch" if count else "Auto-EQ Set")
+            if self.multiBandMgr is not None:
+                if self.autoEQChannels:
+                    self.multiBandMgr.setChannels(self.autoEQChannels)
+                else:
+                    self.stopBandManager()
+
     def startPlotting(self):
         if self.channelNum is not None:
             if not self.plotMgr:
                 print("Starting Plot Manager...")
-                self.plotMgr = PlotManager(self.plot)
+                self.plotMgr = PlotManager(self.plot, waterfallPlot=self.waterfallPlot)
                 self.plotMgr.setLogTicks()
+                self.plotMgr.fpsUpdated.connect(self.showPlotFps)
             if self.rtaToggle.isChecked():
                 self.plotMgr.start()
 
+    def showPlotFps(self, fps):
+        self.plot.setTitle(f"{fps:.0f} fps", size="8pt")
+
     def stopPlotting(self):
         if self.plotMgr:
             print("Stopping Plot Manager...")
             self.plotMgr.shutdown()
+            self.plotMgr.removeItems()
             self.plotMgr = None
 
     def toggleMute(self):
         if self.channelNum is not None:  # Ensure channelNum is set
             channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
             if self.toggleMuteButton.isChecked():
-                self.client.send_message(f'/ch/{channelNumFormatted}/mix/on', 0)
+                self.client.sendParameter(self.channelNum, 'mute', 0)
                 print(f"Channel {channelNumFormatted} is muted.")
             else:
-                self.client.send_message(f'/ch/{channelNumFormatted}/mix/on', 1)
+                self.client.sendParameter(self.channelNum, 'mute', 1)
                 print(f"Channel {channelNumFormatted} is unmuted.")
 
     def togglePitchCorrection(self):
@@ -539,8 +605,12 @@ class AudioPilotUI(QWidget):
             checkedButton = self.pitchButtonGroup.checkedButton()
             if checkedButton:
                 vocalType = checkedButton.text()
-                logging.debug(f"Starting Band Manager with vocalType: {vocalType}")
-                self.startBandManager(vocalType)
+                if self.autoEQChannels:
+                    logging.debug(f"Starting multi-channel Band Manager for channels: {sorted(self.autoEQChannels)}")
+                    self.startMultiChannelBandManager()
+                else:
+                    logging.debug(f"Starting Band Manager with vocalType: {vocalType}")
+                    self.startBandManager(vocalType)
         else:
             logging.debug("Stopping Band Manager")
             self.stopBandManager()
@@ -548,6 +618,7 @@ class AudioPilotUI(QWidget):
 
     def startBandManager(self, vocalType):
         if self.channelNum is not None:
+            self.stopBandManager()
             self.bandThreadRunning.set()
             self.bandMgr = BandManager(self.client)
             self.bandManagerThread = threading.Thread(target=self.runBandManager, args=(vocalType, self.channelNum), daemon=True)
@@ -557,68 +628,80 @@ class AudioPilotUI(QWidget):
             logging.debug("Channel number is not set. Cannot start Band Manager.")
 
 
+    def startMultiChannelBandManager(self):
+        self.stopBandManager()
+        self.multiBandMgr = MultiChannelBandManager(self.client, idleTimeout=self.bandIdleTimeout)
+        self.multiBandMgr.setChannels(self.autoEQChannels)
+        self.multiBandMgr.start()
+
     def stopBandManager(self):
+        if self.multiBandMgr is not None:
+            self.multiBandMgr.stop()
+            self.multiBandMgr = None
+            if self.channelNum is not None:
+                self.client.send_message('/-action/setrtasrc', [self.channelNum])  # RTA back to the selected channel
         if self.bandManagerThread is not None:
             self.bandThreadRunning.clear()
+            mailboxRTA.wake()
+            self.bandManagerThread.join(self.bandMinInterval + self.bandIdleTimeout)
+            self.bandManagerThread = None
 
     def runBandManager(self, vocalType, channel):
+        # Woken by each new RTA frame rather than polling; frames arriving within bandMinInterval
+        # of the last update are coalesced into the next one
         logging.debug(f"Running Band Manager for vocalType: {vocalType}, channel: {channel}")
+        version = 0
+        lastUpdate = 0.0
         while self.bandThreadRunning.is_set():
+            if mailboxRTA.waitForNewer(version, self.bandIdleTimeout) <= version:
+                continue
+            remaining = self.bandMinInterval - (time.monotonic() - lastUpdate)
+            if remaining > 0:
+                time.sleep(remaining)
+                if not self.bandThreadRunning.is_set():
+                    break
+            version = mailboxRTA.latestVersion()
+            lastUpdate = time.monotonic()
             self.bandMgr.updateAllBands(vocalType, channel)
-            logging.debug(f"Updated all bands for vocalType: {vocalType}, channel: {channel}")
-            time.sleep(0.3)
+            logging.debug(f"Updated all bands for vocalType: {vocalType}, channel: {channel}, frame {version}")
 
 
     def changeEqGain(self, value):
         if self.channelNum is None:
             print("Channel number is not set.")
             return
-        closestGainValue = min(eqGainValues.keys(), key=lambda k: abs(k - value))
-        oscGainID = eqGainValues[closestGainValue]
-        channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
-        self.client.send_message(f'/ch/{channelNumFormatted}/eq/{self.selectedBand}/g', [oscGainID])
+        oscGainID = eqGainMap.toFloat(value)
+        self.client.sendParameter(self.channelNum, 'eqGain', oscGainID, band=self.selectedBand)
 
     def changeLowCut(self, value):
         if self.channelNum is None:
             print("Channel number is not set.")
             return
-        closeestFreqValue = min(lowcutFreq.keys(), key=lambda k: abs(k - value))
-        oscFreqID = lowcutFreq[closeestFreqValue]
-        channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
-        self.client.send_message(f'/ch/{channelNumFormatted}/preamp/hpf', [oscFreqID])
+        oscFreqID = lowcutMap.toFloat(value)
+        self.client.sendParameter(self.channelNum, 'hpf', oscFreqID)
 
     def changeFreq(self, value):
+        nearestBin = frequencyIndex.nearestBin(value)
+        self.freqDial.setToolTip(f"{eqFreqMap.quantize(value):.0f} Hz (RTA bin {frequencies[nearestBin]} Hz)")
         if self.channelNum is None:
             print("Channel number is not set.")
             return
-        def freqToFloat(freq):
-            return float(freq)
-
-        floatFrequencies = [freqToFloat(k) for k in eqFreq.keys()]
-        closestFreq = min(floatFrequencies, key=lambda k: abs(k - value))
-        # Find the closest key in its original string format
-        closestFreqKey = min(eqFreq.keys(), key=lambda k: abs(float(k) - closestFreq))
-        oscFrequencyID = eqFreq[closestFreqKey]
-        channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
-        self.client.send_message(f'/ch/{channelNumFormatted}/eq/{self.selectedBand}/f', [oscFrequencyID])
+        oscFrequencyID = eqFreqMap.toFloat(value)
+        self.client.sendParameter(self.channelNum, 'eqFreq', oscFrequencyID, band=self.selectedBand)
 
     def changeQ(self, value):
         if self.channelNum is None:
             print("Channel number is not set.")
             return
-        closestValue = min(qValues.keys(), key=lambda k: abs(k - value))
-        oscQID = qValues[closestValue]
-        channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
-        self.client.send_message(f'/ch/{channelNumFormatted}/eq/{self.selectedBand}/q', [oscQID])
+        oscQID = qMap.toFloat(value)
+        self.client.sendParameter(self.channelNum, 'eqQ', oscQID, band=self.selectedBand)
 
     def changeTrim(self, value):
         if self.channelNum is None:
             print("Channel number is not set.")
             return
-        closestValue = min(trimValues.keys(), key=lambda k: abs(k - value))
-        oscTrimID = trimValues[closestValue]
-        channelNumFormatted = f"{self.channelNum + 1:02}"  # Format channelNum as two-digit
-        self.client.send_message(f'/ch/{channelNumFormatted}/preamp/trim', [oscTrimID])
+        oscTrimID = trimMap.toFloat(value)
+        self.client.sendParameter(self.channelNum, 'trim', oscTrimID)
 
     def toggleEQ(self):
         if self.channelNum is None:
@@ -664,23 +747,34 @@ class AudioPilotUI(QWidget):
             QApplication.quit()
 
 class ChannelSelectorDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, multiSelect=False, selectedChannels=()):
         super().__init__(parent)
-        self.setWindowTitle("Select Channel")
+        self.multiSelect = multiSelect
+        self.selectedChannels = sorted(selectedChannels)  # zero-based channel numbers
+        self.setWindowTitle("Select Channels" if multiSelect else "Select Channel")
         self.initUI()
 
     def initUI(self):
         self.loadStylesheet(rPath("styles.qss"))
         layout = QGridLayout()
         self.channelButtonGroup = QButtonGroup(self)
+        self.channelButtonGroup.setExclusive(not self.multiSelect)
 
         for i in range(1, 33):
             btn = QPushButton(f"CH {i:02}")
             btn.setCheckable(True)
-            btn.clicked.connect(self.chooseChannel)
+            if self.multiSelect:
+                btn.setChecked(i - 1 in self.selectedChannels)
+            else:
+                btn.clicked.connect(self.chooseChannel)
             self.channelButtonGroup.addButton(btn, i)
             layout.addWidget(btn, (i-1)//8, (i-1)%8)
 
+        if self.multiSelect:
+            applyButton = QPushButton("Apply")
+            applyButton.clicked.connect(self.chooseChannels)
+            layout.addWidget(applyButton, 4, 0, 1, 8)
+
         self.setLayout(layout)
 
     def loadStylesheet(self, stylesheet):
@@ -692,3 +786,7 @@ class ChannelSelectorDialog(QDialog):
         if selectedButton:
             self.selectedChannel = selectedButton.text()
             self.accept()
+
+    def chooseChannels(self):
+        self.selectedChannels = [self.channelButtonGroup.id(btn) - 1 for btn in self.channelButtonGroup.buttons() if btn.isChecked()]
+        self.accept()
@@ -3,18 +3,26 @@ import time
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
-from queue import Empty
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QEvent, pyqtSignal, QTimer
 import sys
-from pythonosc.udp_client import SimpleUDPClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import select
+import socket
+import ipaddress
 import logging
 
 logging.basicConfig(level=logging.DEBUG)
 
+try:
+    import psutil
+except ImportError:
+    psutil = None  # optional, only used to read interface netmasks for mixer discovery
 
-from Data import frequencies, dataRTA, bandsRangeRTA, bandRanges, qLimits, gainMultis, eqGainValues, qValues, queueRTA
+
+from rta import SpectrumBallistics, BandStatistics
+from Data import frequencies, dataRTA, channelsRTA, depthRTA, bandsRangeRTA, qLimits, gainMultis, mailboxRTA, spectrogramRTA
+from mappings import eqFreqMap, qMap, eqGainMap
+from quantizers import frequencyIndex
 
 class ApplicationManager:
     def __init__(self, client, server, mixerName):
@@ -35,10 +43,7 @@ class ApplicationManager:
         app = QApplication([])
         from ui import AudioPilotUI  # local import to avoid circular dependency
         mixerUI = AudioPilotUI(self.mixerName, self.client)
-        mixerUI.show()
-
-        plotMgr = PlotManager(mixerUI.plot)
-        mixerUI.plotMgr = plotMgr  # assign the plot manager to the UI
+        mixerUI.show()  # the UI builds its own PlotManager, with the waterfall, once a channel is selected
 
         sys.exit(app.exec())
 
@@ -51,63 +56,237 @@ class MixerManager:
             self.client.send_message('/xremote', None)
             time.sleep(3)
 
+class SpectrumBarItem:
+    """ Draws the whole RTA spectrum as a single BarGraphItem recoloured from a cached palette """
+    floorDB = -90
+
+    def __init__(self, plot, freqs, colors, widthRatio=0.5):
+        # BarGraphItem ignores the plot's log mode, so bars are placed in log10 view coordinates
+        self.palette = np.empty(len(colors), dtype=object)
+        self.palette[:] = [pg.mkBrush(color) for color in colors]
+        logFreqs = np.log10(np.asarray(freqs, dtype=np.float64))
+        spacing = np.diff(logFreqs)
+        widths = np.minimum(np.append(spacing, spacing[-1]), np.insert(spacing, 0, spacing[0])) * widthRatio
+        self.item = pg.BarGraphItem(x=logFreqs, height=np.zeros(len(logFreqs)), width=widths,
+                                    y0=self.floorDB, pen=pg.mkPen(None), brush=self.palette[-1])
+        plot.addItem(self.item)
+
+    def setData(self, dbValues, colorIndices):
+        self.item.setOpts(height=dbValues - self.floorDB, brushes=self.palette[colorIndices])
+
+    def clear(self):
+        self.item.setOpts(height=np.zeros(len(self.item.opts['x'])))
+
+class WaterfallView:
+    """ Scrolling spectrogram of the RTA bins drawn as one ImageItem over the shared SpectrogramBuffer """
+    colorStops = [(0.0, (0, 0, 0)), (0.35, (0, 0, 160)), (0.6, (0, 200, 0)), (0.8, (255, 220, 0)), (1.0, (255, 0, 0))]
+
+    def __init__(self, plot, spectrogram, freqs):
+        self.plot = plot
+        self.spectrogram = spectrogram
+        positions, colors = zip(*self.colorStops)
+        self.lookupTable = pg.ColorMap(list(positions), list(colors)).getLookupTable(0.0, 1.0, 256)
+        self.item = pg.ImageItem()
+        self.item.setLookupTable(self.lookupTable)
+        plot.addItem(self.item)
+        plot.setLabel('bottom', 'Frames')
+        plot.setLabel('left', 'Frequency', units='Hz')
+        plot.getAxis('left').setTicks([[(i + 0.5, f"{freq / 1000:g}k" if freq >= 1000 else str(freq))
+                                        for i, freq in enumerate(freqs) if i % 10 == 0]])
+        plot.setXRange(-spectrogram.rows, 0, padding=0)
+        plot.setYRange(0, len(freqs), padding=0)
+        self.lastCount = -1
+
+    def update(self):
+        if self.spectrogram.count == self.lastCount:
+            return
+        image, self.lastCount = self.spectrogram.snapshot()
+        # x runs from -rows (oldest frame) to 0 (newest frame), one image column per frame
+        self.item.setImage(image, autoLevels=False, levels=(0, 255))
+        self.item.setPos(-self.spectrogram.rows, 0)
+
+    def clear(self):
+        self.item.clear()
+        self.lastCount = -1
+
+class RefreshScheduler(QObject):
+    """ Calls a repaint callback at the incoming frame rate, capped at maxFps, and reports the achieved fps """
+    fpsUpdated = pyqtSignal(float)
+
+    def __init__(self, repaint, frameCounter, maxFps=30.0, idleFps=2.0, headroom=1.25, statsInterval=1.0):
+        super().__init__()
+        self.repaint = repaint  # returns True when something was drawn
+        self.frameCounter = frameCounter  # returns the total number of frames produced so far
+        self.maxFps = maxFps
+        self.idleFps = idleFps  # polling rate while the stream is stalled
+        self.headroom = headroom  # tick slightly faster than frames arrive so none are skipped by aliasing
+        self.statsInterval = statsInterval
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.active = False
+        self.suspended = False
+        self.incomingFps = 0.0
+        self.achievedFps = 0.0
+
+    def start(self):
+        self.active = True
+        self.incomingFps = self.maxFps
+        self.resetStats()
+        self.applyTimer()
+
+    def stop(self):
+        self.active = False
+        self.timer.stop()
+
+    def suspend(self):
+        if not self.suspended:
+            self.suspended = True
+            self.timer.stop()
+
+    def resume(self):
+        if self.suspended:
+            self.suspended = False
+            self.resetStats()
+            self.applyTimer()
+
+    def resetStats(self):
+        self.statsStart = time.monotonic()
+        self.statsFrames = self.frameCounter()
+        self.paints = 0
+
+    def targetInterval(self):
+        fps = min(max(self.incomingFps * self.headroom, self.idleFps), self.maxFps)
+        return int(1000 / fps)
+
+    def applyTimer(self):
+        if self.active and not self.suspended:
+            self.timer.start(self.targetInterval())
+
+    def tick(self):
+        if self.repaint():
+            self.paints += 1
+        elapsed = time.monotonic() - self.statsStart
+        if elapsed >= self.statsInterval:
+            self.incomingFps = (self.frameCounter() - self.statsFrames) / elapsed
+            self.achievedFps = self.paints / elapsed
+            self.fpsUpdated.emit(self.achievedFps)
+            self.resetStats()
+            if self.timer.interval() != self.targetInterval():
+                self.timer.setInterval(self.targetInterval())
+
 class PlotManager(QObject):
-    plotDataUpdated = pyqtSignal(list)
+    # Colour classes from loudest to quietest: at or above each threshold, anything lower is the last colour
+    levelColors = ['r', 'y', 'g', 'b']
+    levelThresholds = [-10, -18, -45]
 
-    def __init__(self, plot):
+    def __init__(self, plot, renderMode='spectrum', maxFps=30.0, waterfallPlot=None, ballistics=None):
         super().__init__()
         self.plot = plot
+        self.ballistics = ballistics or SpectrumBallistics(len(frequencies))
+        # Every peak marker is a short horizontal segment; connect='pairs' draws them all as one item
+        self.peakX = np.repeat(np.asarray(frequencies, dtype=np.float64), 2) * np.tile([0.97, 1.03], len(frequencies))
+        self.peakItem = plot.plot(pen=pg.mkPen('w', width=2), connect='pairs')
+        self.waterfall = WaterfallView(waterfallPlot, spectrogramRTA, frequencies) if waterfallPlot is not None else None
+        self.renderMode = renderMode  # 'spectrum': one item for all bins, 'lines': one item per bin
         self.bars = {}
-        self.executor = None
-        self.lock = threading.Lock()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.updatePlot)
+        self.spectrum = SpectrumBarItem(plot, frequencies, self.levelColors) if renderMode == 'spectrum' else None
+        self.scheduler = RefreshScheduler(self.updatePlot, mailboxRTA.latestVersion, maxFps=maxFps)
+        self.fpsUpdated = self.scheduler.fpsUpdated
         self.plottingActive = False
-        self.plotDataUpdated.connect(self.updatePlotUI)
+        self.lastFrameVersion = 0
+        self.window = None
+        viewWidget = plot.getViewWidget()
+        if viewWidget is not None:
+            self.window = viewWidget.window()
+            self.window.installEventFilter(self)
 
     def start(self):
         if not self.plottingActive:
             print("Starting the plotting timer...")
-            self.executor = ThreadPoolExecutor(max_workers=20)
             self.plottingActive = True
-            self.timer.start(200)
+            self.scheduler.start()
+            self.updateVisibility()
+
+    def eventFilter(self, obj, event):
+        if sip.isdeleted(self.window):
+            return False
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange):
+            self.updateVisibility()
+        return False
+
+    def updateVisibility(self):
+        # Suspend refreshes entirely while the main window is hidden or minimised
+        if self.window is None:
+            return
+        if self.window.isVisible() and not self.window.isMinimized():
+            self.scheduler.resume()
+        else:
+            self.scheduler.suspend()
+
+    def isExposed(self):
+        windowHandle = self.window.windowHandle() if self.window is not None else None
+        return windowHandle is None or windowHandle.isExposed()
 
     def updatePlot(self):
-        if self.executor:
-            future = self.executor.submit(self.processPlotData)
-            future.add_done_callback(self.updatePlotCallback)
+        if not self.isExposed():
+            return False
+        plotData = self.processPlotData()
+        if plotData is None:
+            return False
+        self.updatePlotUI(*plotData)
+        if self.waterfall is not None:
+            self.waterfall.update()
+        return True
 
     def processPlotData(self):
-        try:
-            latestData = queueRTA.get_nowait()
-            threshUpper = -10
-            threshMid = -18
-            threshLower = -45
-            plot_data = []
-            for freq in frequencies:
-                dbValues = latestData.get(freq, [-90])
-                dbLatest = dbValues[-1] if dbValues else -90
-                color = 'r' if dbLatest >= threshUpper else 'y' if threshMid <= dbLatest < threshUpper else 'g' if dbLatest >= threshLower <= threshMid else 'b'
-                plot_data.append((freq, dbLatest, color))
-            return plot_data
-        except Empty:
-            return []
-
-    def updatePlotCallback(self, future):
-        try:
-            plotData = future.result()
-            self.plotDataUpdated.emit(plotData)
-        except Exception as e:
-            print(f"Error updating plot: {e}")
-
-    def updatePlotUI(self, plot_data):
-        with self.lock:
-            for freq, dbLatest, color in plot_data:
-                if freq in self.bars:
-                    self.bars[freq].setData([freq, freq], [dbLatest, -90])
-                    self.bars[freq].setPen(pg.mkPen(color, width=3))
-                else:
-                    self.bars[freq] = self.plot.plot([freq, freq], [dbLatest, -90], pen=pg.mkPen(color, width=3))
+        # Skips the tick (returns None) when no frame has arrived since the last paint
+        latestFrame = mailboxRTA.get(self.lastFrameVersion)
+        if latestFrame is None:
+            return None
+        # Frames overwritten in the mailbox since the last paint still reach the peak markers via the history
+        missedFrames = latestFrame.version - self.lastFrameVersion
+        self.lastFrameVersion = latestFrame.version
+        recentMax = dataRTA.windowMax(missedFrames) if missedFrames > 1 else None
+        dbLatest, peaks = self.ballistics.update(latestFrame.values, latestFrame.timestamp, recentMax)
+        levels = [dbLatest >= thresh for thresh in self.levelThresholds]
+        colorIndices = np.select(levels, range(len(levels)), default=len(levels))
+        return dbLatest, colorIndices, peaks
+
+    def updatePlotUI(self, dbLatest, colorIndices, peaks):
+        self.peakItem.setData(self.peakX, np.repeat(peaks, 2))
+        if self.spectrum is not None:
+            self.spectrum.setData(dbLatest, colorIndices)
+            return
+        for freq, db, colorIndex in zip(frequencies, dbLatest.tolist(), colorIndices.tolist()):
+            pen = pg.mkPen(self.levelColors[colorIndex], width=3)
+            if freq in self.bars:
+                self.bars[freq].setData([freq, freq], [db, -90])
+                self.bars[freq].setPen(pen)
+            else:
+                self.bars[freq] = self.plot.plot([freq, freq], [db, -90], pen=pen)
+
+    def clearPlot(self):
+        self.ballistics.reset()
+        self.peakItem.clear()
+        if self.spectrum is not None:
+            self.spectrum.clear()
+        if self.waterfall is not None:
+            self.waterfall.clear()
+        for bar in self.bars.values():
+            bar.clear()
+
+    def removeItems(self):
+        # Takes everything this manager drew off its plots, so a later manager doesn't draw over frozen items
+        self.plot.removeItem(self.peakItem)
+        if self.spectrum is not None:
+            self.plot.removeItem(self.spectrum.item)
+        for bar in self.bars.values():
+            self.plot.removeItem(bar)
+        self.bars = {}
+        if self.waterfall is not None:
+            self.waterfall.plot.removeItem(self.waterfall.item)
+        if self.window is not None and not sip.isdeleted(self.window):
+            self.window.removeEventFilter(self)
 
     def setLogTicks(self):
         customTicks = [
@@ -121,148 +300,192 @@ class PlotManager(QObject):
 
     def shutdown(self):
         if self.plottingActive:
-            print("Stopping the plotting timer and shutting down the executor...")
+            print("Stopping the plotting timer...")
             self.plottingActive = False
-            self.timer.stop()
-            if self.executor:
-                self.executor.shutdown(wait=True)
-                self.executor = None
+            self.scheduler.stop()
+            print(f"RTA frames: {mailboxRTA.stats()}")
+
+class GainCurveTable:
+    """ dB to gain ID for every vocal type and band, sampled once over floorDB..ceilDB so a band update is one
+    indexed read instead of the gain law, rounding and gain quantization """
+
+    def __init__(self, bandManager, bands, resolution=0.01, floorDB=-90.0, ceilDB=0.0):
+        self.resolution = resolution
+        self.floorDB = floorDB
+        self.ceilDB = ceilDB
+        self.vocalIndex = {vocalType: i for i, vocalType in enumerate(gainMultis)}
+        self.bandIndex = {band: i for i, band in enumerate(bands)}
+        dbValues = np.linspace(floorDB, ceilDB, int(round((ceilDB - floorDB) / resolution)) + 1)
+        self.curves = np.empty((len(self.vocalIndex), len(bands), len(dbValues)))
+        for vocalType, i in self.vocalIndex.items():
+            for band, j in self.bandIndex.items():
+                # Same choice of gain law as updateAllBands
+                if gainMultis[vocalType].get(band, 0) > 0:
+                    gain = bandManager.calculateGainForLowestDB(dbValues, band, vocalType)
+                else:
+                    gain = bandManager.calculateGain(dbValues, band, vocalType)
+                self.curves[i, j] = eqGainMap.toFloat(gain)
+        # Plain lists for scalar lookups, which would otherwise pay NumPy's per-call overhead
+        self.rows = {(vocalType, band): self.curves[i, j].tolist()
+                     for vocalType, i in self.vocalIndex.items() for band, j in self.bandIndex.items()}
+
+    def indices(self, dbValues):
+        dbValues = np.clip(np.nan_to_num(dbValues, nan=self.floorDB), self.floorDB, self.ceilDB)
+        return np.rint((dbValues - self.floorDB) / self.resolution).astype(np.intp)
+
+    def gainID(self, vocalType, band, dbValue):
+        dbValue = min(max(dbValue, self.floorDB), self.ceilDB)
+        return self.rows[(vocalType, band)][round((dbValue - self.floorDB) / self.resolution)]
+
+    def gainIDs(self, vocalIndices, band, dbValues):
+        # One vocal type index per entry of dbValues, e.g. one per channel
+        return self.curves[vocalIndices, self.bandIndex[band], self.indices(dbValues)]
 
 class BandManager:
-    def __init__(self, client):
+    bands = ['Low', 'Low Mid', 'High Mid', 'High']
+    # Minimum change, in console steps, before a band's parameters are sent again
+    defaultHysteresis = {'freq': 1, 'gain': 1, 'q': 1}
+
+    def __init__(self, client, qTolerance=5.0, qWindow=None, hysteresis=None, gainResolution=0.01):
         self.client = client
+        self.hysteresis = dict(self.defaultHysteresis, **(hysteresis or {}))
+        self.hysteresisMaps = [('freq', eqFreqMap), ('gain', eqGainMap), ('q', qMap)]
+        self.lastSent = {}  # (channel, eqBand): (freqID, gainID, qIDValue) last sent to the console
+        self.skippedSends = 0
+        self.qTolerance = qTolerance  # dB distance from the target's peak that counts a bin as part of the resonance
+        self.qWindow = qWindow  # frames of history used for Q estimation, None for the whole history
+        self.bandStatistics = BandStatistics(frequencies, bandsRangeRTA)
+        self.binIndex = {freq: i for i, freq in enumerate(frequencies)}
+        self.gainTable = GainCurveTable(self, self.bands, resolution=gainResolution)
 
     def hasSufficientData(self, freq):
-        return len(dataRTA.get(freq, [])) >= 10
+        return freq in frequencies and dataRTA.isFull()
+
+    def computeBandStats(self, window=None):
+        return self.bandStatistics.compute(dataRTA.window() if window is None else window)
 
-    def findHighestFreqinBand(self, bandName):
-        bandRange = bandsRangeRTA.get(bandName)
-        if not bandRange:
+    def findHighestFreqinBand(self, bandName, stats=None):
+        bandStats = (stats or self.computeBandStats()).get(bandName)
+        if bandStats is None or not bandStats.maxDB > -90.0:
             return None
-        lowBound, upBound = bandRange
-        maxDB = -90.0
-        maxFreq = None
-        for freq, dbValues in dataRTA.items():
-            if lowBound <= freq <= upBound:
-                currentMaxDB = max(dbValues)
-                if currentMaxDB > maxDB:
-                    maxDB = currentMaxDB
-                    maxFreq = freq
-        return maxFreq
-
-    def findLowestFreqinBand(self, bandName):
-        bandRange = bandsRangeRTA.get(bandName)
-        if not bandRange:
+        return frequencies[int(bandStats.maxBin)]
+
+    def findLowestFreqinBand(self, bandName, stats=None):
+        bandStats = (stats or self.computeBandStats()).get(bandName)
+        if bandStats is None or not bandStats.minDB < 0.0:
             return None
-        lowBound, upBound = bandRange
-        minDB = 0.0
-        minFreq = None
-        for freq, dbValues in dataRTA.items():
-            if lowBound <= freq <= upBound:
-                currentMinDB = min(dbValues)
-                if currentMinDB < minDB:
-                    minDB = currentMinDB
-                    minFreq = freq
-        return minFreq
-
-    def findHighestDBinBand(self, bandName):
-        bandRange = bandsRangeRTA.get(bandName)
-        if not bandRange:
+        return frequencies[int(bandStats.minBin)]
+
+    def findHighestDBinBand(self, bandName, stats=None):
+        bandStats = (stats or self.computeBandStats()).get(bandName)
+        if bandStats is None:
             return None
-        lowBound, upBound = bandRange
-        maxDB = -90.0
-        for freq, dbValues in dataRTA.items():
-            if lowBound <= freq <= upBound:
-                currentMaxDB = max(dbValues)
-                if currentMaxDB > maxDB:
-                    maxDB = currentMaxDB
-        return maxDB
-
-    def findLowestDBinBand(self, bandName):
-        bandRange = bandsRangeRTA.get(bandName)
-        if not bandRange:
+        return max(-90.0, float(bandStats.maxDB))
+
+    def findLowestDBinBand(self, bandName, stats=None):
+        bandStats = (stats or self.computeBandStats()).get(bandName)
+        if bandStats is None or np.isnan(bandStats.floorMinDB):
             return None
-        lowBound, upBound = bandRange
-        minDB = None
-        for freq, dbValues in dataRTA.items():
-            if lowBound <= freq <= upBound:
-                filteredDBValues = [db for db in dbValues if db > -60]
-                if filteredDBValues:
-                    currentMinDB = min(filteredDBValues)
-                    if minDB is None or currentMinDB < minDB:
-                        minDB = currentMinDB
-        return minDB
+        return float(bandStats.floorMinDB)
 
     def findClosestFrequency(self, bandName, targetFreq):
-        frequencies = bandRanges.get(bandName, [])
-        if not frequencies or targetFreq is None:
+        if bandName not in frequencyIndex.binIDs or targetFreq is None:
             return None
-        closeFreqData = min(frequencies, key=lambda x: abs(x[1] - targetFreq))
-        return closeFreqData
+        if targetFreq in self.binIndex:
+            freqID, freq = frequencyIndex.forBin(bandName, self.binIndex[targetFreq])
+            return float(freqID), float(freq)
+        return frequencyIndex.forFreq(bandName, targetFreq)
 
     def calculateGain(self, dbValue, band, vocalType):
         freqFlat = -45
         distance = dbValue - freqFlat
         bandMulti = gainMultis.get(vocalType, {}).get(band, -1)
         gain = (distance / 10) * bandMulti
-        return round(gain, 2)
+        return np.round(gain, 2)  # also works on whole arrays of dB values
 
     def calculateGainForLowestDB(self, dbValue, band, vocalType):
         freqFlat = -45
         distance = dbValue - freqFlat
         bandMulti = gainMultis.get(vocalType, {}).get(band, 0)
         gain = np.log(distance - freqFlat * 2) * bandMulti
-        return round(gain, 2)
+        return np.round(gain, 2)  # also works on whole arrays of dB values
 
-    def calculateQValue(self, freq, band):
+    def calculateQValue(self, freq, band, window=None):
         if band not in bandsRangeRTA:
             print(f"Band {band} not found in bandsRangeRTA.")
             return None
         lowBound, upBound = bandsRangeRTA[band]
-        relevantFreqs = {f: dbs for f, dbs in dataRTA.items() if lowBound <= f <= upBound}
-        if freq not in relevantFreqs or not relevantFreqs[freq]:
+        if freq not in self.binIndex or not lowBound <= freq <= upBound:
             print(f"No data or insufficient data for frequency {freq} in band {band}.")
             return None
-        maxDbValue = max(relevantFreqs[freq])
-        similarFreqCount = sum(1 for dbs in relevantFreqs.values() if any(abs(maxDbValue - db) <= 5 for db in dbs))
-        qMax, qMin = qLimits[band]
-        qRange = qMax - qMin
-        bandSize = len(relevantFreqs)
+        bandSize = self.bandStatistics.bandSize(band)
         if bandSize == 0:
             print(f"No frequencies with data in band {band}.")
             return None
+        if window is None:
+            window = dataRTA.window(self.qWindow)
+        similarFreqCount = int(self.bandStatistics.similarBinCount(window, band, self.binIndex[freq], self.qTolerance))
+        qMax, qMin = qLimits[band]
+        qRange = qMax - qMin
         qValue = qMax - (similarFreqCount / bandSize) * qRange
         return round(qValue, 2)
 
     def getClosestQIDValue(self, qValue):
-        if qValue is None or not qValues:
+        if qValue is None:
             return 0.3380
-        closestQ = min(qValues.keys(), key=lambda k: abs(k - qValue))
-        return qValues[closestQ]
-
-    def getClosestGainValue(self, gain, eqGainValues):
-        gainKeys = list(eqGainValues.keys())
-        closestGain = min(gainKeys, key=lambda k: abs(k - gain))
-        return closestGain
-
-    def sendOSCParameters(self, channel, eqBand, freqID, gainID, qIDValue):
+        return qMap.toFloat(qValue)
+
+    def getClosestGainValue(self, gain):
+        return eqGainMap.quantize(gain)
+
+    def exceedsHysteresis(self, lastParameters, parameters):
+        for (name, parameterMap), lastValue, value in zip(self.hysteresisMaps, lastParameters, parameters):
+            # IDs from the table fallback are rounded, so allow a little slack below a whole step
+            if abs(value - lastValue) * (parameterMap.steps - 1) >= self.hysteresis[name] - 0.05:
+                return True
+        return False
+
+    def resetSentCache(self, channel=None):
+        # Forces the next update to be sent, e.g. after the console state was changed elsewhere
+        if channel is None:
+            self.lastSent.clear()
+        else:
+            self.lastSent = {key: value for key, value in self.lastSent.items() if key[0] != channel}
+
+    def shouldSend(self, channel, eqBand, parameters, force=False):
+        lastParameters = self.lastSent.get((channel, eqBand))
+        if not force and lastParameters is not None and not self.exceedsHysteresis(lastParameters, parameters):
+            self.skippedSends += 1
+            return False
+        return True
+
+    def sendOSCParameters(self, channel, eqBand, freqID, gainID, qIDValue, force=False):
+        parameters = (freqID, gainID, qIDValue)
+        if not self.shouldSend(channel, eqBand, parameters, force):
+            return False
         channelFormatted = f"{channel + 1:02}"  # Format channelNum as two-digit
         self.client.send_message(f'/ch/{channelFormatted}/eq/{eqBand}', [2, freqID, gainID, qIDValue])
+        self.lastSent[(channel, eqBand)] = parameters
         print(f"Sent OSC Parameters for channel {channelFormatted}, eqBand {eqBand}: freqID {freqID}, gainID {gainID}, qIDValue {qIDValue}")
+        return True
 
 
     def updateAllBands(self, vocalType, channel):
         logging.debug(f"Updating all bands for vocalType: {vocalType}, channel: {channel}")
-        bands = ['Low', 'Low Mid', 'High Mid', 'High']
-        for index, band in enumerate(bands):
+        # One snapshot per cycle so the band stats and every Q estimate see the same frames
+        window = dataRTA.window()
+        stats = self.computeBandStats(window)
+        qWindow = window if self.qWindow is None else window[-self.qWindow:]
+        messages = []
+        for index, band in enumerate(self.bands):
             multiplier = gainMultis.get(vocalType, {}).get(band, 0)
             logging.debug(f"Processing band: {band}, multiplier: {multiplier}")
             if multiplier > 0:
-                targetDB = self.findLowestDBinBand(band)
-                targetFreq = self.findLowestFreqinBand(band)
+                targetDB = self.findLowestDBinBand(band, stats)
+                targetFreq = self.findLowestFreqinBand(band, stats)
             else:
-                targetDB = self.findHighestDBinBand(band)
-                targetFreq = self.findHighestFreqinBand(band)
+                targetDB = self.findHighestDBinBand(band, stats)
+                targetFreq = self.findHighestFreqinBand(band, stats)
             if targetDB is None or targetFreq is None:
                 logging.debug(f"No dB data or frequency data for band {band}. Skipping...")
                 continue
@@ -270,42 +493,282 @@ class BandManager:
             if freqID is None:
                 logging.debug(f"No closest frequency found for band {band}. Skipping...")
                 continue
-            if multiplier > 0:
-                gainValue = self.calculateGainForLowestDB(targetDB, band, vocalType)
+            if vocalType in self.gainTable.vocalIndex:
+                gainID = self.gainTable.gainID(vocalType, band, targetDB)
+            elif multiplier > 0:
+                gainID = eqGainMap.toFloat(self.calculateGainForLowestDB(targetDB, band, vocalType))
             else:
-                gainValue = self.calculateGain(targetDB, band, vocalType)
-            gainID = eqGainValues[self.getClosestGainValue(gainValue, eqGainValues)]
-            qValue = self.calculateQValue(targetFreq, band)
+                gainID = eqGainMap.toFloat(self.calculateGain(targetDB, band, vocalType))
+            qValue = self.calculateQValue(targetFreq, band, window=qWindow)
             qIDValue = self.getClosestQIDValue(qValue)
-            self.sendOSCParameters(channel, index + 1, freqID, gainID, qIDValue)
-            logging.debug(f"Sent OSC Parameters for band {band}, channel {channel}: freqID {freqID}, gainID {gainID}, qIDValue {qIDValue}")
-
+            if self.shouldSend(channel, index + 1, (freqID, gainID, qIDValue)):
+                messages.append((channel, index + 1, (freqID, gainID, qIDValue)))
+                logging.debug(f"Sending OSC Parameters for band {band}, channel {channel}: freqID {freqID}, gainID {gainID}, qIDValue {qIDValue}")
+            else:
+                logging.debug(f"Band {band}, channel {channel} unchanged within hysteresis. Not sent.")
+        self.sendBatch(messages)
+
+    def sendBatch(self, messages):
+        # (channel, eqBand, parameters) entries from one update, packed into bundles when the client can batch
+        if not messages:
+            return
+        if hasattr(self.client, 'batch'):
+            with self.client.batch() as batch:
+                for channel, eqBand, parameters in messages:
+                    batch.sendParameter(channel, 'eq', (2, *parameters), band=eqBand)
+                    self.lastSent[(channel, eqBand)] = parameters
+            bundleSizes = batch.bundleSizes
+        else:
+            for channel, eqBand, parameters in messages:
+                self.client.send_message(f'/ch/{channel + 1:02}/eq/{eqBand}', [2, *parameters])
+                self.lastSent[(channel, eqBand)] = parameters
+            bundleSizes = [1] * len(messages)
+        logging.debug(f"Sent {len(messages)} band updates for {len({m[0] for m in messages})} channels in {len(bundleSizes)} datagrams {bundleSizes}")
+
+class MultiChannelBandManager(BandManager):
+    """ Auto-EQ for a set of channels: rotates the console's RTA source through them and updates every
+    channel from one analysis pass over the stacked per-channel histories """
+    def __init__(self, client, dwellFrames=depthRTA, settleFrames=2, idleTimeout=1.0, **kwargs):
+        super().__init__(client, **kwargs)
+        self.history = channelsRTA
+        self.dwellFrames = dwellFrames  # frames captured per channel before moving the RTA source on
+        self.settleFrames = settleFrames  # frames dropped after a source change
+        self.idleTimeout = idleTimeout
+        self.vocalTypes = {}  # channel: vocal type
+        self.channelsLock = threading.Lock()
+        self.running = threading.Event()
+        self.thread = None
+        self.passes = 0
+
+    def setChannel(self, channel, vocalType):
+        with self.channelsLock:
+            self.vocalTypes[channel] = vocalType
+
+    def removeChannel(self, channel):
+        with self.channelsLock:
+            self.vocalTypes.pop(channel, None)
+        self.forgetChannel(channel)
+
+    def setChannels(self, vocalTypes):
+        with self.channelsLock:
+            removed = set(self.vocalTypes) - set(vocalTypes)
+            self.vocalTypes = dict(vocalTypes)
+        for channel in removed:
+            self.forgetChannel(channel)
+
+    def forgetChannel(self, channel):
+        # A channel added again later starts from fresh spectra rather than what it sounded like back then
+        if self.history.activeChannel == channel:
+            self.history.setActiveChannel(None)
+        self.history.clear(channel)
+        self.resetSentCache(channel)
+
+    def channels(self):
+        with self.channelsLock:
+            return sorted(self.vocalTypes)
+
+    def selectSource(self, channel):
+        if channel != self.history.activeChannel:
+            self.client.send_message('/-action/setrtasrc', [channel])
+            self.history.setActiveChannel(channel, self.settleFrames)
+        else:
+            self.history.setActiveChannel(channel)
 
-class MixerDiscovery:
-    def __init__(self, port=10023):
-        self.port = port
-        self.subnets = ["192.168.10", "192.168.1", "192.168.56"]
+    def start(self):
+        if self.thread is None:
+            self.running.set()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.running.clear()
+            mailboxRTA.wake()
+            self.thread.join(self.idleTimeout + 1.0)
+            self.thread = None
+        self.history.setActiveChannel(None)
 
-    def checkMixerIP(self, ip):
+    def run(self):
+        # Visits each channel for dwellFrames frames; every completed cycle ends with one analysis pass over
+        # the channels that finished their dwell in that cycle
+        version = 0
+        pending = []
+        sampled = set()
+        while self.running.is_set():
+            activeChannel = self.history.activeChannel
+            dwellDone = self.history.activeFrames >= self.dwellFrames
+            with self.channelsLock:
+                selected = activeChannel in self.vocalTypes
+            if activeChannel is None or dwellDone or not selected:
+                if dwellDone and selected:
+                    sampled.add(activeChannel)
+                if not pending:
+                    if sampled:
+                        self.updateAllChannels(sampled)
+                    sampled = set()
+                    pending = self.channels()
+                while pending:
+                    channel = pending.pop(0)
+                    with self.channelsLock:
+                        # Checked under the lock so a channel removed since pending was built is never selected
+                        if channel in self.vocalTypes:
+                            self.selectSource(channel)
+                            break
+            version = mailboxRTA.waitForNewer(version, self.idleTimeout)
+
+    def updateAllChannels(self, channels=None):
+        # channels limits the pass to those channels, e.g. the ones sampled this cycle; None means all of them
+        with self.channelsLock:
+            vocalTypes = dict(self.vocalTypes)
+        # Channels with a vocal type that has no gain curve are left alone
+        channels = self.history.fullChannels([channel for channel, vocalType in sorted(vocalTypes.items())
+                                              if vocalType in self.gainTable.vocalIndex
+                                              and (channels is None or channel in channels)])
+        if len(channels) == 0:
+            return 0
+        window = self.history.window(channels)
+        stats = self.bandStatistics.compute(window)
+        qWindow = window if self.qWindow is None else window[:, -self.qWindow:]
+        vocalIndices = np.array([self.gainTable.vocalIndex[vocalTypes[channel]] for channel in channels])
+        messages = []
+        for index, band in enumerate(self.bands):
+            bandStats = stats.get(band)
+            if bandStats is None:
+                continue
+            # Same targets as updateAllBands: the quietest bin for boosted bands, the loudest for cut bands
+            multipliers = np.array([gainMultis.get(vocalTypes[channel], {}).get(band, 0) for channel in channels])
+            boost = multipliers > 0
+            valid = np.where(boost, ~np.isnan(bandStats.floorMinDB) & (bandStats.minDB < 0.0), bandStats.maxDB > -90.0)
+            targetBin = np.where(boost, bandStats.minBin, bandStats.maxBin)
+            targetDB = np.where(boost, bandStats.floorMinDB, np.maximum(bandStats.maxDB, -90.0))
+            similarFreqCount = self.bandStatistics.similarBinCount(qWindow, band, targetBin, self.qTolerance)
+            qMax, qMin = qLimits[band]
+            qValue = np.round(qMax - similarFreqCount / self.bandStatistics.bandSize(band) * (qMax - qMin), 2)
+
+            freqIDs = frequencyIndex.binIDs[band][targetBin]
+            gainIDs = self.gainTable.gainIDs(vocalIndices, band, targetDB)
+            qIDs = qMap.toFloat(qValue)
+            for i in np.flatnonzero(valid):
+                channel = int(channels[i])
+                parameters = (float(freqIDs[i]), float(gainIDs[i]), float(qIDs[i]))
+                if self.shouldSend(channel, index + 1, parameters):
+                    messages.append((channel, index + 1, parameters))
+        self.passes += 1
+        self.sendBatch(messages)
+        return len(messages)
+
+
+def localNetworks():
+    """ IPv4 networks of this host's interfaces, from psutil when it is installed, otherwise from the
+    addresses the host name resolves to and the default route's source address, assumed to be /24 """
+    networks = []
+    if psutil is not None:
+        for addresses in psutil.net_if_addrs().values():
+            for address in addresses:
+                if address.family == socket.AF_INET and address.netmask:
+                    networks.append(ipaddress.IPv4Interface(f"{address.address}/{address.netmask}"))
+    else:
+        hostIPs = set()
         try:
-            tempClient = SimpleUDPClient(ip, self.port)
-            tempClient.send_message('/xinfo', None)
-            ready = select.select([tempClient._sock], [], [], 0.1)
-            if ready[0]:
-                data, addr = tempClient._sock.recvfrom(1024)
-                return addr[0], data
-        except Exception:
+            hostIPs.update(socket.gethostbyname_ex(socket.gethostname())[2])
+        except OSError:
             pass
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            probe.connect(('192.0.2.1', 9))  # no packet is sent, this only picks the outgoing interface
+            hostIPs.add(probe.getsockname()[0])
+        except OSError:
+            pass
+        finally:
+            probe.close()
+        networks = [ipaddress.IPv4Interface(f"{ip}/24") for ip in hostIPs]
+    # Loopback and link-local (169.254/16) ranges never hold a console worth sweeping
+    return [interface for interface in networks if not interface.ip.is_loopback and not interface.ip.is_link_local]
+
+class MixerDiscovery:
+    """ Finds consoles with /xinfo from one non-blocking socket: a broadcast per subnet first, then a paced
+    unicast sweep, with replies collected by one select loop until the scan deadline """
+    xinfoRequest = b'/xinfo\x00\x00,\x00\x00\x00'
+    fallbackSubnets = ["192.168.10.0/24", "192.168.1.0/24", "192.168.56.0/24"]
 
-    def discoverMixers(self):
+    def __init__(self, port=10023, timeout=0.8, burstSize=64, burstInterval=0.002, subnets=None, maxSweepPrefix=20):
+        self.port = port
+        self.subnets = subnets  # None to use the host's own interfaces, worked out on every scan
+        self.timeout = timeout  # seconds for the whole scan, sweep included
+        self.burstSize = burstSize  # unicast probes sent between two checks for replies
+        self.burstInterval = burstInterval  # pause after each burst so the probes do not flood the LAN
+        self.maxSweepPrefix = maxSweepPrefix  # networks larger than this are only swept around the host's address
+
+    def scanNetworks(self):
+        # (network, own address or None) pairs to probe
+        if self.subnets is not None:
+            return [(ipaddress.IPv4Network(subnet, strict=False), None) for subnet in self.subnets]
+        interfaces = localNetworks()
+        if not interfaces:
+            return [(ipaddress.IPv4Network(subnet), None) for subnet in self.fallbackSubnets]
+        return list({interface.network: interface.ip for interface in interfaces}.items())
+
+    def sweepTargets(self, networks):
+        targets = []
+        for network, ownIP in networks:
+            if network.prefixlen < self.maxSweepPrefix:
+                anchor = ownIP if ownIP is not None else network.network_address
+                network = ipaddress.IPv4Network(f"{anchor}/{self.maxSweepPrefix}", strict=False)
+            targets.extend(str(ip) for ip in network.hosts() if ip != ownIP)
+        return targets
+
+    def broadcastTargets(self, networks):
+        return ["255.255.255.255"] + [str(network.broadcast_address) for network, _ in networks if network.prefixlen < 31]
+
+    def sendProbe(self, sock, ip):
+        try:
+            sock.sendto(self.xinfoRequest, (ip, self.port))
+        except BlockingIOError:
+            select.select([], [sock], [], 0.05)  # send buffer full, wait for room and try once more
+            try:
+                sock.sendto(self.xinfoRequest, (ip, self.port))
+            except OSError:
+                pass
+        except OSError:
+            pass  # unreachable subnet or broadcast not permitted on this interface
+
+    def collectReplies(self, sock, discIPs, timeout, onMixerFound=None):
         from osc_handlers import OscHandlers
+        while True:
+            ready, _, _ = select.select([sock], [], [], max(timeout, 0))
+            if not ready:
+                return
+            timeout = 0  # drain whatever else is already queued without waiting again
+            try:
+                data, addr = sock.recvfrom(1024)
+            except (BlockingIOError, ConnectionResetError):
+                continue
+            if data.startswith(b'/xinfo') and addr[0] not in discIPs:
+                discIPs[addr[0]] = OscHandlers().handlerXInfo(data)
+                if onMixerFound is not None:
+                    onMixerFound(addr[0], discIPs[addr[0]])
+
+    def discoverMixers(self, onMixerFound=None):
+        # onMixerFound(ip, details) is called from this thread as soon as each reply arrives
         discIPs = {}
-        with ThreadPoolExecutor(max_workers=100) as executor:
-            futures = {executor.submit(self.checkMixerIP, f"{subnet}.{i}"): f"{subnet}.{i}" for subnet in self.subnets for i in range(256)}
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    ip, rawData = result
-                    details = OscHandlers().handlerXInfo(rawData)
-                    discIPs[ip] = details
+        deadline = time.monotonic() + self.timeout
+        networks = self.scanNetworks()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.setblocking(False)
+            sock.bind(('', 0))
+            for ip in self.broadcastTargets(networks):
+                self.sendProbe(sock, ip)
+            targets = self.sweepTargets(networks)
+            for start in range(0, len(targets), self.burstSize):
+                for ip in targets[start:start + self.burstSize]:
+                    self.sendProbe(sock, ip)
+                self.collectReplies(sock, discIPs, self.burstInterval, onMixerFound)
+                if time.monotonic() >= deadline:
+                    break
+            while time.monotonic() < deadline:
+                self.collectReplies(sock, discIPs, deadline - time.monotonic(), onMixerFound)
+        finally:
+            sock.close()
         return discIPs